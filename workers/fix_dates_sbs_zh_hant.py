@@ -3,18 +3,46 @@
 import json, sys, re, html
 from pathlib import Path
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound
+
+try:
+    import orjson  # 快好多嘅 JSON 讀寫；冇裝就用返 json
+except Exception:
+    orjson = None
 
 HEADERS = {"User-Agent": "HKersInOZBot/1.0 (+news-aggregator; contact: you@example.com)"}
 TIMEOUT = 20
+FETCH_WORKERS = 8   # 同時補幾多條；都係同一個站，唔好開太多
+HEAD_RANGE = "bytes=0-16383"   # 日期 meta 喺 <head>，通常頭 16KB 已經有
 INPUT_JSON = Path("sbs_zh_hant.json")   # 由 workers/scrape_sbs_zh_hant.py 產出
 OUTPUT_JSON = Path("sbs_zh_hant.json")  # 覆寫返同一份
 
+def _make_session() -> requests.Session:
+    """共用 Session：全部都係 www.sbs.com.au，keep-alive 重用連線，唔使每條 link 再握手"""
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+SESSION = _make_session()
+
 def iso_now(): return datetime.now(timezone.utc).isoformat()
 
+_WS_RE = re.compile(r"\s+")
+_JSON_OBJ_RE = re.compile(r"\{.*?\}", re.S)
+
 def clean(s):
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS_RE.sub(" ", (s or "")).strip()
 
 def normalize_date(raw: str | None) -> str | None:
     if not raw: return None
@@ -40,14 +68,93 @@ def normalize_date(raw: str | None) -> str | None:
     except Exception:
         return None
 
+# ---- regex 快速路徑：唔砌 DOM，直接喺原始 HTML 攞 <meta> / JSON-LD ----
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.I)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_LD_JSON_RE = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+
+def _meta_map(html_text: str) -> dict[str, str]:
+    """一次過掃晒 <meta>：property / name ➜ content（同名取第一個）"""
+    out: dict[str, str] = {}
+    for tag in _META_TAG_RE.findall(html_text):
+        attrs = {k.lower(): html.unescape(v1 or v2) for k, v1, v2 in _ATTR_RE.findall(tag)}
+        content = attrs.get("content")
+        if not content:
+            continue
+        for key in (attrs.get("property"), attrs.get("name")):
+            if key and key not in out:
+                out[key] = content
+    return out
+
+def _date_from_ld(txt: str) -> str | None:
+    """JSON-LD 中嘅 datePublished / dateCreated（@graph 內或者直屬 NewsArticle / Article）"""
+    for candidate in _iter_json_candidates(txt):
+        # @graph 內的 NewsArticle
+        if isinstance(candidate, dict) and "@graph" in candidate:
+            for g in candidate["@graph"]:
+                if isinstance(g, dict) and g.get("@type") in ("NewsArticle","Article"):
+                    dt = normalize_date(g.get("datePublished") or g.get("dateCreated"))
+                    if dt: return dt
+        # 直屬 NewsArticle
+        if isinstance(candidate, dict) and candidate.get("@type") in ("NewsArticle","Article"):
+            dt = normalize_date(candidate.get("datePublished") or candidate.get("dateCreated"))
+            if dt: return dt
+    return None
+
+def date_from_html_fast(html_text: str) -> str | None:
+    """同 date_from_soup 一樣次序，但全部用 regex；搵唔到回 None（交返 soup 兜底）"""
+    metas = _meta_map(html_text)
+    for key in ("article:published_time", "og:article:published_time"):
+        dt = normalize_date(metas.get(key))
+        if dt: return dt
+    for txt in _LD_JSON_RE.findall(html_text):
+        dt = _date_from_ld(txt)
+        if dt: return dt
+    return normalize_date(metas.get("date"))
+
+_HEAD_END_B_RE = re.compile(rb"</head\s*>", re.I)
+
+def fetch_head_only(url: str, chunk_size: int = 4096) -> tuple[str, bool]:
+    """
+    Range + 串流 GET：一見到 </head> 就收線（伺服器唔理 Range 都唔會落晒成頁）。
+    回 (已收到嘅 HTML, 係咪唔完整)。
+    """
+    with SESSION.get(url, headers={"Range": HEAD_RANGE}, timeout=TIMEOUT,
+                     allow_redirects=True, stream=True) as r:
+        r.raise_for_status()
+        buf = bytearray()
+        cut = False
+        for chunk in r.iter_content(chunk_size=chunk_size):
+            start = max(0, len(buf) - 16)  # </head> 可能橫跨兩個 chunk
+            buf.extend(chunk)
+            if _HEAD_END_B_RE.search(buf, start):
+                cut = True
+                break
+    text = bytes(buf).decode(r.encoding or "utf-8", errors="replace")
+    return text, cut or r.status_code == 206
+
 def fetch_date_from_page(url: str) -> str | None:
+    # 先淨係攞頁頭；頭度搵唔到（例如 JSON-LD 喺 body）先抓全頁
+    try:
+        head, partial = fetch_head_only(url)
+    except Exception:
+        return None
+    dt = date_from_html_fast(head)
+    if dt or not partial:
+        return dt or date_from_soup(head)
     try:
-        r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+        r = SESSION.get(url, timeout=TIMEOUT, allow_redirects=True)
         r.raise_for_status()
     except Exception:
         return None
+    return date_from_html_fast(r.text) or date_from_soup(r.text)
 
-    soup = BeautifulSoup(r.text, "html.parser")
+def date_from_soup(html_text: str) -> str | None:
+    """regex 食唔到嘅怪寫法先砌 soup；用 lxml 做 builder，冇裝先退返 html.parser"""
+    try:
+        soup = BeautifulSoup(html_text, "lxml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(html_text, "html.parser")
 
     # 1) meta: article:published_time / og:article:published_time
     for key in ("article:published_time", "og:article:published_time"):
@@ -58,18 +165,8 @@ def fetch_date_from_page(url: str) -> str | None:
 
     # 2) JSON-LD 中嘅 datePublished / dateCreated
     for tag in soup.find_all("script", type=lambda t: t and "ld+json" in t):
-        txt = tag.string or tag.get_text() or ""
-        for candidate in _iter_json_candidates(txt):
-            # @graph 內的 NewsArticle
-            if isinstance(candidate, dict) and "@graph" in candidate:
-                for g in candidate["@graph"]:
-                    if isinstance(g, dict) and g.get("@type") in ("NewsArticle","Article"):
-                        dt = normalize_date(g.get("datePublished") or g.get("dateCreated"))
-                        if dt: return dt
-            # 直屬 NewsArticle
-            if isinstance(candidate, dict) and candidate.get("@type") in ("NewsArticle","Article"):
-                dt = normalize_date(candidate.get("datePublished") or candidate.get("dateCreated"))
-                if dt: return dt
+        dt = _date_from_ld(str(tag.string or tag.get_text() or ""))
+        if dt: return dt
 
     # 3) 某些頁面會用 <meta name="date">
     tag = soup.find("meta", attrs={"name":"date"})
@@ -92,7 +189,7 @@ def _iter_json_candidates(txt: str):
     except Exception:
         pass
     # 兜底：逐個 {...} 嘗試
-    for m in re.finditer(r"\{.*?\}", txt, re.S):
+    for m in _JSON_OBJ_RE.finditer(txt):
         frag = m.group(0)
         try:
             yield json.loads(frag)
@@ -104,25 +201,27 @@ def main():
         print(f"[ERR] {INPUT_JSON} not found. Run workers/scrape_sbs_zh_hant.py first.", file=sys.stderr)
         sys.exit(1)
 
-    payload = json.loads(INPUT_JSON.read_text(encoding="utf-8"))
+    raw = INPUT_JSON.read_bytes()
+    payload = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
     items = payload.get("items", [])
     changed = 0
 
-    for it in items:
-        pub = it.get("publishedAt")
-        if pub:  # 已有日期，跳過
-            continue
-        link = it.get("link")
-        if not link:
-            continue
-        dt = fetch_date_from_page(link)
-        if dt:
-            it["publishedAt"] = dt
-            changed += 1
+    # 已有日期或者冇 link 嘅跳過；其餘併發抓（每條都係等網絡，CPU 閒住）
+    todo = [it for it in items if not it.get("publishedAt") and it.get("link")]
+    if todo:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(todo))) as ex:
+            for it, dt in zip(todo, ex.map(fetch_date_from_page, [it["link"] for it in todo])):
+                if dt:
+                    it["publishedAt"] = dt
+                    changed += 1
 
     payload["generatedAt"] = iso_now()
     payload["count"] = len(items)
-    OUTPUT_JSON.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # orjson 直接出 UTF-8 bytes（等同 ensure_ascii=False）
+        OUTPUT_JSON.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        OUTPUT_JSON.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"[DONE] fixed {changed} items with missing dates (total {len(items)})")
 
 if __name__ == "__main__":
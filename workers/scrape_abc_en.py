@@ -1,26 +1,49 @@
 # workers/scrape_abc_en.py
 
-import json, re, sys, html, hashlib, time
+import json, re, sys, html, hashlib, time, threading, heapq, math
 from datetime import datetime, timezone
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
 from zoneinfo import ZoneInfo
-from urllib.parse import urlparse, parse_qs, unquote, urljoin
-from collections import deque
+from urllib.parse import urlparse, parse_qs, unquote, urljoin, urlencode
+from collections import deque, defaultdict
+from itertools import chain
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from xml.etree import ElementTree as ET
 
+try:
+    from lxml import html as LH  # C parser + XPath，比 BeautifulSoup 快好多；冇裝就退返 bs4
+    from lxml import etree as LET  # sitemap / RSS 串流解析
+except Exception:
+    LH = LET = None
+
+try:
+    import httpx  # HTTP/2 多工（pip install "httpx[http2]"）；冇裝就退返 requests
+except Exception:
+    httpx = None
+
 # ---------------- 基本設定 ----------------
 HEADERS = {"User-Agent": "HKersInOZBot/1.0 (+news-aggregator; contact: you@example.com)"}
 TIMEOUT = 25
 MAX_ITEMS = 200  # 想再多可以加大
-FETCH_SLEEP = 0.4
+FETCH_INTERVAL = 0.2  # 同一 host 兩個 request 起步之間最少隔幾多秒（≈ 每秒 5 個）
+FETCH_WORKERS = 8  # 同時抓 + 解析幾多頁
+PER_HOST_LIMIT = 6  # 同一個 host 最多幾多個 request 同時進行（禮貌）
 ABC_HOST = "www.abc.net.au"
 ROBOTS_URL = "https://www.abc.net.au/robots.txt"
 # URL 正規化：固定 Host / Scheme 及移除 tracking 參數
 CANON_HOST = "www.abc.net.au"
 CANON_SCHEME = "https"
 SYD = ZoneInfo("Australia/Sydney")
+# 文章 ETag / Last-Modified 快取（repo root；workflow 會一齊 commit 返）
+CACHE_PATH = "abc_en_cache.json"
+CACHE_MAX_AGE_DAYS = 7
 
 # 入口頁（已剔走 environment / technology 兩條經常 404/403 的入口）
 ENTRY_BASES = [
@@ -61,12 +84,38 @@ GN_URL = (
     "&hl=en-AU&gl=AU&ceid=AU:en"
 )
 
+# ---------------- 預編譯 regex（熱 loop 入面用，唔好每次重新查 pattern cache） ----------------
+_WS_RE = re.compile(r"\s+")
+_NEWS_DATE_RE = re.compile(r"/news/\d{4}-\d{2}-\d{2}/")
+_LOC_RE = re.compile(r"<loc>\s*(.*?)\s*</loc>")
+_ABS_URL_RE = re.compile(r'https?://[^\s\'">]+')
+# sitemap 只收 /news/ 文章：日期段，或者 /news/ 之後有 article / stories 段
+_SITEMAP_KEEP = re.compile(r"/news/(?:\d{4}-\d{2}-\d{2}/|(?:.*/)?(?:article|stories)/)")
+_ARTICLE_ID_RE = re.compile(r"/\d{5,}$")  # 文章頁 path 以數字 id 收尾
+# canonical_abc_url 會剷走嘅 query（全部細楷比較）
+_DROP_QUERY_KEYS = {"wt.mc_id", "wt.tsrc", "sf", "amp", "output"}
+_SKIP_EXTS = (".mp3", ".mp4", ".jpg", ".jpeg", ".png", ".gif", ".pdf")
+
 # ---------------- 小工具 ----------------
 def iso_now():
     return datetime.now(timezone.utc).isoformat()
 
 def clean(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS_RE.sub(" ", (s or "")).strip()
+
+def _content_digest(title: str, summary: str) -> str:
+    """
+    內容指紋：標題 + 摘要壓埋空白、轉細楷再 md5。
+    同一篇文經唔同 URL（Google News redirect、舊 path 等）入嚟都會撞返同一個 digest。
+    數字要留：「Week 1」/「Week 2」、比分、傷亡更新淨係數字唔同，都係唔同嘅文。
+    """
+    norm = clean(f"{title}\n{summary}").lower()
+    return hashlib.md5(norm.encode("utf-8")).hexdigest()
+
+@lru_cache(maxsize=4096)
+def _url_id(canon: str) -> str:
+    """穩定 id：canonical URL 嘅 md5（同以前輸出一致）；每條 URL 只計一次"""
+    return hashlib.md5(canon.encode("utf-8")).hexdigest()
 
 def to_iso(dt: datetime) -> str:
     """Datetime ➜ ISO8601（保留偏移）"""
@@ -90,12 +139,14 @@ def as_sydney(dt_utc: datetime | None) -> datetime | None:
         return None
     return dt_utc.astimezone(SYD)
 
+@lru_cache(maxsize=16384)
 def canonical_abc_url(u: str) -> str:
     """
     把 ABC 文章 URL 正規化：
       - 強制 https://www.abc.net.au
       - 移除 fragment
-      - 剷走常見 tracking query（utm_*、?sf、?WT.* 等）
+      - 剷走常見 tracking query（utm_*、?sf、?WT.*、?amp 等）
+      - 文章頁（日期 path / 數字 id 收尾）成個 query 唔要
       - 去除多餘的結尾斜線（但保留 path 本身）
     """
     try:
@@ -106,18 +157,20 @@ def canonical_abc_url(u: str) -> str:
         # 設定規範 host/scheme
         netloc = CANON_HOST
         scheme = CANON_SCHEME
+        path = p.path.rstrip("/")  # 多數 ABC 內容頁無尾斜線
+        # 文章頁嘅 query 全部係 tracking / amp 變體
+        if _NEWS_DATE_RE.search(path + "/") or _ARTICLE_ID_RE.search(path):
+            return f"{scheme}://{netloc}{path}"
         # 清理 query
         qs = parse_qs(p.query, keep_blank_values=False)
         cleaned = {}
         for k, v in qs.items():
             lk = k.lower()
-            if lk.startswith("utm_") or lk in {"WT.mc_id", "WT.tsrc", "sf"}:
+            if lk.startswith("utm_") or lk in _DROP_QUERY_KEYS:
                 continue
             cleaned[k] = v
         # 重新組裝
-        from urllib.parse import urlencode
         new_q = urlencode({k: vals[0] for k, vals in cleaned.items()}) if cleaned else ""
-        path = p.path.rstrip("/")  # 多數 ABC 內容頁無尾斜線
         return f"{scheme}://{netloc}{path}" + (f"?{new_q}" if new_q else "")
     except Exception:
         return u
@@ -142,7 +195,6 @@ def normalize_date(raw: str | None) -> str | None:
         pass
     # RFC822/1123
     try:
-        from email.utils import parsedate_to_datetime
         dt = parsedate_to_datetime(s)
         if not dt:
             return None
@@ -152,11 +204,135 @@ def normalize_date(raw: str | None) -> str | None:
     except Exception:
         return None
 
-def fetch(url: str) -> requests.Response:
-    r = requests.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+def _make_session() -> requests.Session:
+    """共用 Session：keep-alive + 連線池，唔使每篇文章重新 TCP/TLS 握手"""
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+SESSION = _make_session()
+
+def fetch(url: str, headers: dict | None = None) -> requests.Response:
+    r = SESSION.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True)
+    r.raise_for_status()
+    # ABC 全站 UTF-8；header 冇 charset 時 requests 會行 charset 偵測（慢）或者當 latin-1
+    if not r.encoding or r.encoding.lower() == "iso-8859-1":
+        r.encoding = "utf-8"
+    return r
+
+def _make_h2_client():
+    """
+    探索階段（robots / sitemap / 入口頁 / BFS / RSS / Google News）共用嘅 HTTP/2 client：
+    同一 host 只開一條 TLS 連線，多個 request 喺上面多工。
+    未裝 httpx 或 h2 就回 None（fetch_discovery 會退返 requests）。
+    """
+    if httpx is None:
+        return None
+    try:
+        return httpx.Client(
+            http2=True,
+            headers=HEADERS,
+            timeout=httpx.Timeout(TIMEOUT, connect=8.0),
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            follow_redirects=True,
+        )
+    except Exception as e:
+        print(f"[WARN] http2 client unavailable, fallback requests: {e}", file=sys.stderr)
+        return None
+
+H2_CLIENT = _make_h2_client()
+
+def fetch_discovery(url: str):
+    """探索階段用：有 HTTP/2 client 就用，否則同 fetch() 一樣"""
+    if H2_CLIENT is None:
+        return fetch(url)
+    r = H2_CLIENT.get(url)
     r.raise_for_status()
     return r
 
+class RateLimiter:
+    """
+    簡單時間閘：每個 request 預留一個起步時間，兩個之間最少隔 interval 秒。
+    只有真係太密先會 sleep；唔似以前每抓完一頁都固定瞓 FETCH_SLEEP。
+    """
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+# 每個 host 一個 semaphore + 一個限速閘，所有 thread pool 共用
+_HOST_SLOTS = defaultdict(lambda: threading.BoundedSemaphore(PER_HOST_LIMIT))
+_HOST_LIMITERS = defaultdict(lambda: RateLimiter(FETCH_INTERVAL))
+_HOST_SLOTS_LOCK = threading.Lock()
+
+def _host_slot(url: str) -> tuple[threading.BoundedSemaphore, RateLimiter]:
+    host = urlparse(url).netloc.lower()
+    with _HOST_SLOTS_LOCK:
+        return _HOST_SLOTS[host], _HOST_LIMITERS[host]
+
+def _fetch_text(fetcher, url: str, read: str | None = "text", parse=None):
+    """
+    工作線程用：回 response 嘅 read 屬性（"text" / "content"；None 就成個 response）；
+    有 parse 就喺工作線程順手 parse(url, 結果)，主線程唔使排隊解析。
+    失敗回 exception（交返主線程 log）
+    """
+    slot, limiter = _host_slot(url)
+    with slot:
+        limiter.wait()
+        try:
+            r = fetcher(url)
+            got = r if read is None else getattr(r, read)
+        except Exception as e:
+            return e
+    # 解析唔使佔住 host slot
+    try:
+        return parse(url, got) if parse else got
+    except Exception as e:
+        return e
+
+def fetch_many(urls: list[str], fetcher=None, read: str | None = "text", parse=None):
+    """
+    用 thread pool 並發抓 urls，按輸入次序 yield (url, text 或 Exception)。
+    read="content" 就 yield bytes（XML 直接交俾 iterparse）；read=None 就 yield response。
+    有 parse 就 yield parse(url, 結果)（喺工作線程做，lxml 解析時會放 GIL）。
+    最多只預先排 2×FETCH_WORKERS 個 request；呼叫方中途 break（例如夠 MAX_ITEMS），
+    後面嘅 URL 根本唔會發出。
+    """
+    fetcher = fetcher or fetch
+    ex = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    todo = iter(urls)
+    window = deque()
+
+    def submit_next() -> None:
+        u = next(todo, None)
+        if u is not None:
+            window.append((u, ex.submit(_fetch_text, fetcher, u, read, parse)))
+
+    try:
+        for _ in range(FETCH_WORKERS * 2):
+            submit_next()
+        while window:
+            u, fut = window.popleft()
+            yield u, fut.result()
+            submit_next()
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
 # ---------------- Category 判斷（URL 優先） ----------------
 def _slug_title_en(slug: str) -> str:
     m = {
@@ -209,12 +385,51 @@ def category_from_entry_base(base: str) -> str | None:
     return None
 
 # ---------------- JSON-LD / meta 解析 ----------------
-def parse_json_ld(html_text: str):
+# bs4 後備只需要呢幾種 tag（meta / title / time / JSON-LD script），其餘 div/span/img 唔起 tree
+_ARTICLE_STRAINER = SoupStrainer(["meta", "title", "time", "script"])
+
+def parse_html(html_text: str):
+    """
+    HTML ➜ 文件樹：有 lxml 就用 lxml.html（XPath），否則 BeautifulSoup。
+    下面幾個 helper 兩種樹都食得，make_item 只 parse 一次再傳落去。
+    """
+    if LH is not None:
+        try:
+            return LH.document_fromstring(html_text)
+        except ValueError:
+            # 帶 <?xml encoding=...?> 聲明嘅 str lxml 唔收，轉返 bytes
+            return LH.document_fromstring(html_text.encode("utf-8"))
+        except Exception:
+            pass
+    return BeautifulSoup(html_text, "html.parser", parse_only=_ARTICLE_STRAINER)
+
+def _as_doc(doc):
+    """接受 HTML 字串或已 parse 好嘅樹"""
+    return parse_html(doc) if isinstance(doc, (str, bytes)) else doc
+
+# JSON-LD 直接喺原始 HTML 抽，唔使為咗幾個 <script> parse 成頁
+_LDJSON_RE = re.compile(
+    r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I
+)
+
+def _ld_texts(doc) -> list[str]:
+    """所有 <script type="...ld+json"> 嘅內容；HTML 字串就用 regex，搵唔到先 parse"""
+    if isinstance(doc, str):
+        found = _LDJSON_RE.findall(doc)
+        if found or "ld+json" not in doc:
+            return found
+        doc = parse_html(doc)  # 有 ld+json 但寫法 regex 食唔到，先 parse
+    if isinstance(doc, BeautifulSoup):
+        return [
+            tag.string or tag.get_text() or ""
+            for tag in doc.find_all("script", type=lambda t: t and "ld+json" in t)
+        ]
+    return [t.text or "" for t in doc.xpath('//script[contains(@type, "ld+json")]')]
+
+def parse_json_ld(doc):
     """由 JSON-LD 取 headline/description/date/url/section（NewsArticle/Article）。"""
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
-        for tag in soup.find_all("script", type=lambda t: t and "ld+json" in t):
-            txt = tag.string or tag.get_text() or ""
+        for txt in _ld_texts(doc):
             try:
                 data = json.loads(txt)
             except Exception:
@@ -270,26 +485,56 @@ def parse_json_ld(html_text: str):
         pass
     return {}
 
-def extract_meta_from_html(html_text: str):
-    soup = BeautifulSoup(html_text, "html.parser")
-    title = (soup.find("meta", property="og:title") or {}).get("content") \
-        or (soup.title.string if soup.title else "") \
+def _meta_map(doc) -> dict[tuple[str, str], str]:
+    """
+    一次過行晒所有 <meta>，以 (屬性, 值) 做 key 收 content，例如
+    ("property", "og:title")、("name", "description")、("itemprop", "datePublished")；
+    同一個 key 以第一個有 content 嘅為準。
+    """
+    out: dict[tuple[str, str], str] = {}
+    metas = doc.find_all("meta") if isinstance(doc, BeautifulSoup) else doc.iter("meta")
+    for m in metas:
+        content = m.get("content")
+        if not content:
+            continue
+        for attr in ("property", "name", "itemprop"):
+            k = m.get(attr)
+            if k and (attr, k) not in out:
+                out[(attr, k)] = content
+    return out
+
+def _title_and_time(doc) -> tuple[str, str | None]:
+    """<title> 文字 + 第一個 <time datetime> 嘅值"""
+    if isinstance(doc, BeautifulSoup):
+        title = doc.title.string if doc.title else ""
+        t = doc.find("time", attrs={"datetime": True})
+        return title or "", (t.get("datetime") if t else None)
+    title = doc.findtext(".//title") or ""
+    dts = doc.xpath("//time/@datetime")
+    return title, (str(dts[0]) if dts else None)
+
+def extract_meta_from_html(doc):
+    doc = _as_doc(doc)
+    meta = _meta_map(doc)
+    page_title, time_dt = _title_and_time(doc)
+    title = meta.get(("property", "og:title")) \
+        or page_title \
         or ""
-    desc = (soup.find("meta", property="og:description") or {}).get("content") \
-        or (soup.find("meta", attrs={"name": "description"}) or {}).get("content") \
+    desc = meta.get(("property", "og:description")) \
+        or meta.get(("name", "description")) \
         or ""
     pub = (
-        (soup.find("meta", property="article:published_time") or {}).get("content")
-        or (soup.find("meta", property="og:article:published_time") or {}).get("content")
-        or (soup.find("meta", property="og:published_time") or {}).get("content")
-        or (soup.find("meta", attrs={"itemprop": "datePublished"}) or {}).get("content")
-        or (soup.find("time", attrs={"datetime": True}) or {}).get("datetime")
-        or (soup.find("meta", attrs={"name": "date"}) or {}).get("content")
+        meta.get(("property", "article:published_time"))
+        or meta.get(("property", "og:article:published_time"))
+        or meta.get(("property", "og:published_time"))
+        or meta.get(("itemprop", "datePublished"))
+        or time_dt
+        or meta.get(("name", "date"))
         or None
     )
     section = (
-        (soup.find("meta", property="article:section") or {}).get("content")
-        or (soup.find("meta", attrs={"name": "section"}) or {}).get("content")
+        meta.get(("property", "article:section"))
+        or meta.get(("name", "section"))
         or None
     )
     return clean(title), clean(desc), pub, section
@@ -300,19 +545,39 @@ def make_item(url: str, html_text: str, hint_section: str | None = None, source_
     section = category_from_url(canon) or hint_section
 
     # 2) 內容頁解析（日期 + 可能的分類後備）
-    ld = parse_json_ld(html_text)
+    #    JSON-LD 用 regex 直接抽；要行 meta 後備先至 parse 成頁（都係只 parse 一次）
+    #    有 ld+json 但 regex 食唔到：喺度 parse 一次，JSON-LD 同 meta 後備共用同一棵樹
+    doc = html_text
+    if "ld+json" in html_text and not _LDJSON_RE.search(html_text):
+        doc = parse_html(html_text)
+    ld = parse_json_ld(doc)
     if ld:
         title = clean(ld.get("headline", "")) or None
         desc = clean(ld.get("description", "")) or ""
         pub = normalize_date(ld.get("datePublished") or None)
         section = section or (ld.get("articleSection") or None)
         if not title:
-            t2, d2, p2, s2 = extract_meta_from_html(html_text)
+            t2, d2, p2, s2 = extract_meta_from_html(doc)
             title = t2; desc = desc or d2; pub = pub or normalize_date(p2); section = section or s2
     else:
-        t2, d2, p2, s2 = extract_meta_from_html(html_text)
+        t2, d2, p2, s2 = extract_meta_from_html(doc)
         title = t2; desc = d2; pub = normalize_date(p2); section = section or s2
 
+    return _build_item(url, canon, title, desc, pub, section, source_hint)
+
+def item_from_feed(entry: dict) -> dict:
+    """RSS <item> 已經有 title / description / pubDate：直接砌 item，唔使再抓文章頁"""
+    canon = canonical_abc_url(entry["link"])
+    return _build_item(
+        canon, canon,
+        entry.get("title"), entry.get("summary") or "",
+        normalize_date(entry.get("pubDate")),
+        category_from_url(canon),
+        entry.get("source") or "ABC News (RSS)",
+    )
+
+def _build_item(url: str, canon: str, title: str | None, desc: str, pub: str | None,
+                section: str | None, source_hint: str) -> dict:
     # ✅ 本地時間欄位（AEST/AEDT）：以 publishedAt（UTC）為基礎；再加 fetchedAtLocal
     pub_utc_dt = ensure_utc_from_iso(pub)
     pub_local_dt = as_sydney(pub_utc_dt)
@@ -320,7 +585,7 @@ def make_item(url: str, html_text: str, hint_section: str | None = None, source_
     fetched_local_dt = as_sydney(fetched_utc_dt)
     
     return {
-        "id": hashlib.md5(canon.encode()).hexdigest(),
+        "id": _url_id(canon),
         "title": title or url,
         "link": url,
         "summary": desc,
@@ -341,17 +606,40 @@ SITEMAP_RE = re.compile(r"(?im)^\s*Sitemap:\s*(https?://\S+)\s*$")
 
 def sitemaps_from_robots() -> list[str]:
     try:
-        txt = fetch(ROBOTS_URL).text
+        txt = fetch_discovery(ROBOTS_URL).text
     except Exception as e:
         print(f"[WARN] robots fetch fail: {e}", file=sys.stderr)
         return []
     return SITEMAP_RE.findall(txt)
 
-def parse_sitemap_urls(xml_text: str) -> list[str]:
+def iter_xml(content: bytes, tag):
+    """
+    lxml iterparse：逐個 yield 指定 tag 嘅 element，用完即 clear 兼剷走前面兄弟，
+    大 sitemap 都唔使成份 XML 留喺記憶體。
+    """
+    for _, el in LET.iterparse(BytesIO(content), tag=tag):
+        yield el
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+
+def parse_sitemap_urls(xml: bytes | str) -> list[str]:
     ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+    if isinstance(xml, str):
+        xml = xml.encode("utf-8")
+    if LET is not None:
+        try:
+            urls = []
+            for el in iter_xml(xml, ("{%s}url" % ns["sm"], "{%s}sitemap" % ns["sm"])):
+                loc = el.findtext("sm:loc", namespaces=ns)
+                if loc:
+                    urls.append(loc.strip())
+            return urls
+        except Exception:
+            pass
     urls = []
     try:
-        root = ET.fromstring(xml_text)
+        root = ET.fromstring(xml)
         for loc in root.findall(".//sm:url/sm:loc", ns):
             if loc.text:
                 urls.append(loc.text.strip())
@@ -359,26 +647,21 @@ def parse_sitemap_urls(xml_text: str) -> list[str]:
             if loc.text:
                 urls.append(loc.text.strip())
     except ET.ParseError:
-        urls = [m.group(1) for m in re.finditer(r"<loc>\s*(.*?)\s*</loc>", xml_text)]
+        xml_text = xml.decode("utf-8", "replace")
+        urls = [m.group(1) for m in _LOC_RE.finditer(xml_text)]
     return urls
 
 def collect_from_sitemaps() -> list[str]:
     all_sitemaps = sitemaps_from_robots()
     out = []
-    for sm in all_sitemaps:
-        if not sm.lower().endswith(".xml"):
-            continue
+    xml_sitemaps = [sm for sm in all_sitemaps if sm.lower().endswith(".xml")]
+    for sm, xml in fetch_many(xml_sitemaps, fetcher=fetch_discovery, read="content"):
         try:
-            xml = fetch(sm).text
+            if isinstance(xml, Exception):
+                raise xml
             urls = parse_sitemap_urls(xml)
-            for u in urls:
-                # 只收 /news/ 文章（日期/或 article/stories 段）
-                if "/news/" in u and (
-                    re.search(r"/news/\d{4}-\d{2}-\d{2}/", u)
-                    or "/news/" in u and "/article/" in u
-                    or "/news/" in u and "/stories/" in u
-                ):
-                    out.append(u)
+            # 只收 /news/ 文章（日期/或 article/stories 段）；一條 regex 過濾
+            out.extend(canonical_abc_url(u) for u in urls if _SITEMAP_KEEP.search(u))
         except Exception as e:
             print(f"[WARN] sitemap fail {sm}: {e}", file=sys.stderr)
             continue
@@ -392,34 +675,47 @@ def collect_from_sitemaps() -> list[str]:
     return uniq
 
 # ---------------- B) 入口頁抽 link（含 script/JSON） ----------------
-ARTICLE_HREF_RE = re.compile(
-    r'https?://www\.abc\.net\.au/news/[A-Za-z0-9\-/_.]+'
-)
 REL_ARTICLE_RE = re.compile(
     r'/news/[A-Za-z0-9\-/_.]+'
 )
 
-def links_from_html_anywhere(html_text: str, base: str) -> list[str]:
-    links = set()
-    soup = BeautifulSoup(html_text, "html.parser")
-    # 1) <a>
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+# 抽 link 唔使成棵 DOM：直接喺原始 HTML 掃 href="..."（# 之後嘅 fragment 唔要）
+_HREF_RE = re.compile(r'href=["\']([^"\'#]+)')
+
+def hrefs_from_html(html_text: str, base: str):
+    """逐個 yield 頁面入面嘅 href（相對路徑已 join 成絕對 URL）"""
+    for m in _HREF_RE.finditer(html_text):
+        href = html.unescape(m.group(1).strip())
         if href.startswith("/"):
             href = urljoin(base, href)
+        yield href
+
+def _looks_like_article(u: str) -> bool:
+    """
+    /news/ 文章頁：含 /news/YYYY-MM-DD/ 或 /article/ 段。
+    大部分候選 link 用平價嘅 substring 測試已經可以剔走，唔使行 regex。
+    """
+    if "/news/" not in u:
+        return False
+    if "/article/" in u:
+        return True
+    if u.count("-") < 2:
+        return False
+    return bool(_NEWS_DATE_RE.search(u))
+
+def links_from_html_anywhere(html_text: str, base: str) -> list[str]:
+    links = set()
+    # 1) <a href>
+    for href in hrefs_from_html(html_text, base):
         if "/news/" in href:
             links.add(href)
     # 2) script/JSON 文字內的 URL
-    for m in ARTICLE_HREF_RE.finditer(html_text):
-        links.add(m.group(0))
+    #    相對 regex 本身已經會喺絕對 URL 入面 match 到 /news/... 一段，
+    #    所以只掃一次 HTML（唔再另外跑絕對 URL regex 將同一條 link 計兩次）
     for m in REL_ARTICLE_RE.finditer(html_text):
         links.add(urljoin(base, m.group(0)))
     # 盡量限制只係文章頁（含日期或 article 段）
-    filtered = []
-    for u in links:
-        if re.search(r"/news/\d{4}-\d{2}-\d{2}/", u) or ("/news/" in u and "/article/" in u):
-            filtered.append(u)
-    return filtered
+    return [u for u in links if _looks_like_article(u)]
 
 def pagination_candidates(base_url: str, pages_each: int) -> list[str]:
     """生成常見分頁：?page=N、/page/N/；第 1 頁係 base 本身。"""
@@ -435,95 +731,128 @@ def pagination_candidates(base_url: str, pages_each: int) -> list[str]:
             seen.add(u); uniq.append(u)
     return uniq
 
-def collect_from_entrypages() -> dict[str, str | None]:
+def collect_from_entrypages(pages: dict[str, str] | None = None) -> dict[str, str | None]:
     """
     對每個入口首頁抓連結，並帶上入口分類 hint。
     回傳：{ article_url: category_hint_or_None }
+    有傳 pages 就將抓到嘅入口頁 HTML 存返入去（BFS 用返，唔使再抓一次）。
     """
     out: dict[str, str | None] = {}
-    for base in ENTRY_BASES:
+    for base, html_text in fetch_many(ENTRY_BASES, fetcher=fetch_discovery):
         hint = category_from_entry_base(base)
         try:
-            html_text = fetch(base).text
+            if isinstance(html_text, Exception):
+                raise html_text
+            if pages is not None:
+                pages[base] = html_text
             for u in links_from_html_anywhere(html_text, base=base):
                 cu = canonical_abc_url(u)
                 out.setdefault(cu, hint)
         except Exception as e:
             print(f"[WARN] entry scrape fail {base}: {e}", file=sys.stderr)
             continue
-        time.sleep(0.2)
     return out
 
 # ---------------- C) /news/ 區淺層 BFS 爬（擴大覆蓋） ----------------
 def should_visit(url: str) -> bool:
     if not url.startswith(SECTION_ALLOWED_PREFIXES):
         return False
-    if any(x in url for x in [".mp3", ".mp4", ".jpg", ".jpeg", ".png", ".gif", ".pdf"]):
+    if any(x in url for x in _SKIP_EXTS):
         return False
     return True
 
-def crawl_news_section(seeds: list[str], max_pages: int = 80) -> list[str]:
+class BloomFilter:
+    """
+    細細個 bloom filter（bytearray 做 bit array；blake2b 雙雜湊出 k 個位置）。
+    每條 URL 大約 20 bit，比 set[str] 逐條存字串慳好多；誤判率 error_rate（只會多 skip 一頁）。
+    """
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.k = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        for i in range(self.k):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+def crawl_news_section(seeds: list[str], max_pages: int = 80,
+                       prefetched: dict[str, str] | None = None) -> list[str]:
+    """prefetched：已經抓過嘅頁（例如入口頁）{url: html}，直接用，唔再 request"""
+    prefetched = prefetched or {}
     q = deque()
-    seen_pages = set()
+    # 已入隊嘅頁：每頁幾百條 href，用 bloom filter 代替 set 保持記憶體平穩
+    seen_pages = BloomFilter(capacity=max(10_000, max_pages * 500))
     found_articles = set()
     for s in seeds:
         if should_visit(s):
             q.append(s); seen_pages.add(s)
     pages_visited = 0
     while q and pages_visited < max_pages:
-        url = q.popleft()
-        try:
-            html_text = fetch(url).text
-        except Exception as e:
-            print(f"[WARN] crawl fetch fail {url}: {e}", file=sys.stderr)
-            continue
-        # 1) 抽文章 link
-        for art in links_from_html_anywhere(html_text, base=url):
-            found_articles.add(art)
-        # 2) 將頁面內可巡航 link 入隊
-        soup = BeautifulSoup(html_text, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if href.startswith("/"):
-                href = urljoin(url, href)
-            if not href or href in seen_pages:
+        # 一層一批：每次由隊頭攞最多 FETCH_WORKERS 頁並發抓（唔超過剩餘額度）
+        batch = [q.popleft() for _ in range(min(len(q), FETCH_WORKERS, max_pages - pages_visited))]
+        ready = [(u, prefetched[u]) for u in batch if u in prefetched]
+        todo = [u for u in batch if u not in prefetched]
+        for url, html_text in chain(ready, fetch_many(todo, fetcher=fetch_discovery)):
+            if isinstance(html_text, Exception):
+                print(f"[WARN] crawl fetch fail {url}: {html_text}", file=sys.stderr)
                 continue
-            if should_visit(href):
-                seen_pages.add(href)
-                q.append(href)
-        pages_visited += 1
-        time.sleep(FETCH_SLEEP)
+            # 1) 抽文章 link
+            for art in links_from_html_anywhere(html_text, base=url):
+                found_articles.add(canonical_abc_url(art))
+            # 2) 將頁面內可巡航 link 入隊（同樣係 regex 掃 href，唔再 parse DOM）
+            for href in hrefs_from_html(html_text, url):
+                if not href or href in seen_pages:
+                    continue
+                if should_visit(href):
+                    seen_pages.add(href)
+                    q.append(href)
+            pages_visited += 1
     return list(found_articles)
 
 # ---------------- D) RSS 補位（官方多 feed） ----------------
+def _rss_fields(xml: bytes) -> list[tuple[str, str, str, str, str]]:
+    """RSS <item> ➜ [(link, title, description, guid, pubDate)]；有 lxml 就串流，否則 stdlib ET"""
+    def fields(it):
+        return tuple(it.findtext(k) or "" for k in ("link", "title", "description", "guid", "pubDate"))
+    if LET is not None:
+        try:
+            return [fields(it) for it in iter_xml(xml, "item")]
+        except Exception:
+            pass
+    return [fields(it) for it in ET.fromstring(xml).findall(".//item")]
+
 def collect_from_rss() -> list[dict]:
     items = []
-    for feed in ABC_FEEDS:
-        try:
-            xml = fetch(feed).text
-        except Exception as e:
-            print(f"[WARN] rss fetch fail {feed}: {e}", file=sys.stderr)
+    for feed, xml in fetch_many(ABC_FEEDS, fetcher=fetch_discovery, read="content"):
+        if isinstance(xml, Exception):
+            print(f"[WARN] rss fetch fail {feed}: {xml}", file=sys.stderr)
             continue
         try:
-            root = ET.fromstring(xml)
-            for it in root.findall(".//item"):
-                link = (it.findtext("link") or "").strip()
-                title = clean(it.findtext("title") or "")
-                desc = clean(it.findtext("description") or "")
-                if not link:
-                    link = (it.findtext("guid") or "").strip()
+            for link, title, desc, guid, pub in _rss_fields(xml):
+                link = link.strip() or guid.strip()
                 if not link:
                     continue
+                title = clean(title)
                 items.append({
                     "title": title or link,
                     "link": link,
-                    "summary": desc,
+                    "summary": clean(desc),
+                    "pubDate": pub.strip() or None,
                     "source": "ABC News (RSS)",
                 })
         except Exception as e:
             print(f"[WARN] parse rss fail {feed}: {e}", file=sys.stderr)
             continue
-        time.sleep(0.2)
     # 去重 by link
     seen = set(); uniq = []
     for it in items:
@@ -536,7 +865,7 @@ def extract_abc_url_from_text(text: str) -> str | None:
     if not text:
         return None
     text = html.unescape(text)
-    for m in re.finditer(r'https?://[^\s\'">]+', text):
+    for m in _ABS_URL_RE.finditer(text):
         u = m.group(0)
         if ABC_HOST in u:
             return u
@@ -562,33 +891,80 @@ def decode_gn_item_to_article_url(link_text: str, guid_text: str | None, desc_ht
             pass
     return None
 
+# Google News RSS 係扁平 RSS 2.0：直接喺 bytes 上用 regex 抽 <item> 欄位，唔使建 XML tree
+_RE_RSS_ITEM = re.compile(rb"<item>(.*?)</item>", re.S)
+_RE_RSS_LINK = re.compile(rb"<link>([^<]+)</link>")
+_RE_RSS_GUID = re.compile(rb"<guid[^>]*>([^<]+)</guid>")
+_RE_RSS_DESC = re.compile(rb"<description>(.*?)</description>", re.S)
+
+def _rss_field(pattern: re.Pattern, block: bytes) -> str:
+    """取 RSS 欄位文字：CDATA 原樣；否則解返 XML entity（同 ET.findtext 一致）"""
+    m = pattern.search(block)
+    if not m:
+        return ""
+    txt = m.group(1).decode("utf-8", "ignore").strip()
+    if txt.startswith("<![CDATA[") and txt.endswith("]]>"):
+        return txt[9:-3]
+    return html.unescape(txt)
+
 def collect_from_google_news() -> list[str]:
     try:
-        xml = fetch(GN_URL).text
+        xml = fetch_discovery(GN_URL).content
     except Exception as e:
         print(f"[WARN] google news fetch fail: {e}", file=sys.stderr)
         return []
     urls = []
-    try:
-        root = ET.fromstring(xml)
-        for it in root.findall(".//item"):
-            link_text = (it.findtext("link") or "").strip()
-            guid_text = (it.findtext("guid") or "").strip()
-            desc_html = it.findtext("description") or ""
-            real = decode_gn_item_to_article_url(link_text, guid_text, desc_html)
-            if not real:
-                continue
-            if "/news/" in real:
-                urls.append(real)
-    except Exception as e:
-        print(f"[WARN] parse google news rss fail: {e}", file=sys.stderr)
-        return []
+    for m in _RE_RSS_ITEM.finditer(xml):
+        block = m.group(1)
+        link_text = _rss_field(_RE_RSS_LINK, block)
+        guid_text = _rss_field(_RE_RSS_GUID, block)
+        desc_html = _rss_field(_RE_RSS_DESC, block)
+        real = decode_gn_item_to_article_url(link_text, guid_text, desc_html)
+        if not real:
+            continue
+        if "/news/" in real:
+            urls.append(real)
     seen = set(); uniq = []
     for u in urls:
         if u not in seen:
             seen.add(u); uniq.append(u)
     return uniq
 
+# ---------------- 文章快取（conditional GET） ----------------
+def load_cache(path: str = CACHE_PATH) -> dict:
+    """{ canonical_url: {"etag", "lastModified", "item", "ts"} }；冇檔 / 壞檔就當空"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def save_cache(cache: dict, path: str = CACHE_PATH) -> None:
+    """寫返快取；超過 CACHE_MAX_AGE_DAYS 冇再見過嘅 URL 順手清走"""
+    cutoff = datetime.now(timezone.utc).timestamp() - CACHE_MAX_AGE_DAYS * 86400
+    kept = {}
+    for u, ent in cache.items():
+        dt = ensure_utc_from_iso(ent.get("ts"))
+        if dt and dt.timestamp() >= cutoff:
+            kept[u] = ent
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(kept, f, ensure_ascii=False, separators=(",", ":"))
+    except Exception as e:
+        print(f"[WARN] write cache fail {path}: {e}", file=sys.stderr)
+
+def conditional_headers(ent: dict | None) -> dict | None:
+    """有舊 ETag / Last-Modified 就帶 If-None-Match / If-Modified-Since"""
+    if not ent or not ent.get("item"):
+        return None
+    h = {}
+    if ent.get("etag"):
+        h["If-None-Match"] = ent["etag"]
+    if ent.get("lastModified"):
+        h["If-Modified-Since"] = ent["lastModified"]
+    return h or None
+
 # ---------------- 輸出 ----------------
 def json_out(items, path):
     now_utc = datetime.now(timezone.utc)
@@ -600,8 +976,9 @@ def json_out(items, path):
         "count": len(items),
         "items": items
     }
+    # 緊湊輸出：唔 indent，分隔符唔加空格（檔案細一半，寫得快）
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
 
 def rss_out(items, path):
     try:
@@ -630,12 +1007,13 @@ if __name__ == "__main__":
 
     # B) 入口頁直抓（只抓入口首頁；不再嘗試分頁）
     seed_pages = ENTRY_BASES[:]
-    url_to_hint = collect_from_entrypages()
+    entry_html: dict[str, str] = {}
+    url_to_hint = collect_from_entrypages(pages=entry_html)
     urls_b = list(url_to_hint.keys())
     print(f"[INFO] entry page urls: {len(urls_b)}", file=sys.stderr)
 
     # C) /news/ 區淺層 BFS（擴大覆蓋；以入口首頁作為種子）
-    urls_crawl = crawl_news_section(seeds=seed_pages, max_pages=80)
+    urls_crawl = crawl_news_section(seeds=seed_pages, max_pages=80, prefetched=entry_html)
     print(f"[INFO] crawl urls: {len(urls_crawl)}", file=sys.stderr)
 
     # 合併 URL 去重（保留入口分類 hint）
@@ -647,69 +1025,111 @@ if __name__ == "__main__":
         if cu not in seen:
             seen.add(cu); merged_urls.append(cu)
 
-    # 逐篇抓
+    # 並發抓文章兼解析（工作線程做 make_item；fetch_many 按次序交返，去重仍喺主線程）
     articles = []
     fetched = set()  # 避免同一篇抓兩次（http/https、帶參數等）
-    for u in merged_urls:
+    seen_links: set[str] = set()  # 去重 by link（set 查，唔再逐篇 any() 掃）
+    seen_digests: set[str] = set()  # 去重 by 內容（URL 唔同但同一篇）
+
+    def accept(item: dict) -> bool:
+        """link 或內容見過就唔要；否則登記並回 True"""
+        if item["link"] in seen_links:
+            return False
+        digest = _content_digest(item["title"], item["summary"])
+        if digest in seen_digests:
+            return False
+        seen_links.add(item["link"])
+        seen_digests.add(digest)
+        return True
+
+    # 上次抓過嘅文章：帶 ETag / Last-Modified，304 就唔使再 parse
+    cache = load_cache()
+
+    def fetch_article(u: str) -> requests.Response:
+        return fetch(u, headers=conditional_headers(cache.get(u)))
+
+    def article_item(cu: str, r: requests.Response, **kw) -> tuple[dict, dict]:
+        """
+        304 用返快取 item（更新 fetchedAt）；否則 parse。喺 worker thread 跑，
+        回 (item, 新快取 entry)，由主線程寫入 cache：break 之後仲跑緊嘅 worker 唔會同 save_cache 撞。
+        """
+        ent = cache.get(cu) or {}
+        if r.status_code == 304 and ent.get("item"):
+            item = dict(ent["item"])
+            now = datetime.now(timezone.utc)
+            item["fetchedAt"] = to_iso(now)
+            item["fetchedAtLocal"] = to_iso(as_sydney(now))
+        else:
+            item = make_item(cu, r.text, **kw)
+        return item, {
+            "etag": r.headers.get("ETag") or ent.get("etag"),
+            "lastModified": r.headers.get("Last-Modified") or ent.get("lastModified"),
+            "item": item,
+            "ts": iso_now(),
+        }
+
+    def pending(urls: list[str]) -> list[str]:
+        """正規化 + 去重，剔走已經抓過嘅"""
+        return [cu for cu in dict.fromkeys(map(canonical_abc_url, urls)) if cu not in fetched]
+
+    def parse_main(cu: str, r: requests.Response) -> tuple[dict, dict]:
+        return article_item(cu, r, hint_section=hint_map.get(cu), source_hint="ABC News")
+
+    for cu, got in fetch_many(pending(merged_urls), fetcher=fetch_article, read=None, parse=parse_main):
         try:
-            cu = canonical_abc_url(u)
-            if cu in fetched:
-                continue
-            html_text = fetch(cu).text
-            hint = hint_map.get(cu)
-            item = make_item(cu, html_text, hint_section=hint, source_hint="ABC News")
-            # 去重 by link
-            if any(x["link"] == item["link"] for x in articles):
+            if isinstance(got, Exception):
+                raise got
+            item, cache[cu] = got
+            # 去重 by link / 內容
+            if not accept(item):
                 continue
             articles.append(item)
             fetched.add(cu)
-            time.sleep(FETCH_SLEEP)
         except Exception as e:
-            print(f"[WARN] fetch article fail {u}: {e}", file=sys.stderr)
+            print(f"[WARN] fetch article fail {cu}: {e}", file=sys.stderr)
 
     # D) 如果仍然未夠 → RSS 補位
     if len(articles) < MAX_ITEMS // 2:
         print("[INFO] few items; fallback ABC RSS", file=sys.stderr)
-        rss_items = collect_from_rss()
-        for it in rss_items:
-            link = it["link"]
+        # feed 本身已有 title / description / pubDate，直接砌 item，唔再逐篇抓文章頁
+        for it in collect_from_rss():
             try:
-                cu = canonical_abc_url(link)
+                cu = canonical_abc_url(it["link"])
                 if cu in fetched:
                     continue
-                html_text = fetch(cu).text
-                item = make_item(cu, html_text, source_hint=it.get("source") or "ABC News (RSS)")
-                if any(x["link"] == item["link"] for x in articles):
+                item = item_from_feed(it)
+                if not accept(item):
                     continue
                 articles.append(item)
                 fetched.add(cu)
                 if len(articles) >= MAX_ITEMS:
                     break
-                time.sleep(FETCH_SLEEP)
             except Exception as e:
-                print(f"[WARN] ABC RSS article fetch fail {link}: {e}", file=sys.stderr)
+                print(f"[WARN] ABC RSS item fail {it.get('link')}: {e}", file=sys.stderr)
 
     # E) 仍然唔夠 → Google News 補位
     if len(articles) < MAX_ITEMS // 2:
         print("[INFO] still few; fallback Google News", file=sys.stderr)
         urls_gn = collect_from_google_news()
         print(f"[INFO] google news urls: {len(urls_gn)}", file=sys.stderr)
-        for u in urls_gn:
+        def parse_gn(cu: str, r: requests.Response) -> tuple[dict, dict]:
+            return article_item(cu, r, source_hint="ABC via Google News")
+
+        for cu, got in fetch_many(pending(urls_gn), fetcher=fetch_article, read=None, parse=parse_gn):
             try:
-                cu = canonical_abc_url(u)
-                if cu in fetched:
-                    continue
-                html_text = fetch(cu).text
-                item = make_item(cu, html_text, source_hint="ABC via Google News")
-                if any(x["link"] == item["link"] for x in articles):
+                if isinstance(got, Exception):
+                    raise got
+                item, cache[cu] = got
+                if not accept(item):
                     continue
                 articles.append(item)
                 fetched.add(cu)
                 if len(articles) >= MAX_ITEMS:
                     break
-                time.sleep(FETCH_SLEEP)
             except Exception as e:
-                print(f"[WARN] GN article fetch fail {u}: {e}", file=sys.stderr)
+                print(f"[WARN] GN article fetch fail {cu}: {e}", file=sys.stderr)
+
+    save_cache(cache)
 
     # 以 publishedAt 排序（desc）；無日期放最後，最後截 MAX_ITEMS
     def key_dt(it):
@@ -721,8 +1141,8 @@ if __name__ == "__main__":
         except Exception:
             return datetime.min.replace(tzinfo=timezone.utc)
 
-    articles.sort(key=key_dt, reverse=True)
-    latest = articles[:MAX_ITEMS]
+    # 只要頭 MAX_ITEMS 篇：heap 揀 top-K，唔使成個 list 排序
+    latest = heapq.nlargest(MAX_ITEMS, articles, key=key_dt)
 
     # 輸出到 repo root（配合 Pages: root）
     json_out(latest, "abc_en.json")
@@ -1,9 +1,30 @@
 # workers/scrape_aucd_rss.py
-import json, time, hashlib, requests, feedparser, re
+import json, time, hashlib, requests, feedparser, re, heapq
 from zoneinfo import ZoneInfo
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
+from lxml import etree as lxml_etree
+from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import datetime as dt
+from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import chain
+
+try:
+    # feedparser 內部用嘅 HTML 清理：lxml 快路抽出嚟嘅 summary 要過同一套先輸出
+    from feedparser.sanitizer import _sanitize_html as _fp_sanitize_html
+    from feedparser.urls import resolve_relative_uris as _fp_resolve_uris
+except Exception:
+    _fp_sanitize_html = _fp_resolve_uris = None
+
+try:
+    import orjson  # 快好多嘅 JSON 序列化；冇裝就用返 json
+except Exception:
+    orjson = None
 
 HEADERS = {
     "User-Agent": "HKersInOZBot/1.0 (+news-aggregator; contact: you@example.com)",
@@ -11,11 +32,13 @@ HEADERS = {
 }
 TIMEOUT = 20
 SLEEP = 0.4
+WORKERS = 8             # 同時幾多個 request（RSS 頁 / 分類頁 / 文章頁）
 
 SITE = "https://aucd.com.au"
 SOURCE_NAME = "澳洲新報"
 MAX_PAGES = 8           # RSS 翻頁嘗試上限
 MAX_ITEMS = 300         # 總輸出上限
+FEED_CACHE_PATH = "aucd_feed_cache.json"  # RSS 頁 ETag / Last-Modified + 上次 items（repo root）
 
 # —— 分類連結 & 每類要爬幾頁 ——
 CATEGORY_URLS = [
@@ -88,9 +111,16 @@ def now_utc() -> dt.datetime:
 def now_iso_utc() -> str:
     return to_iso(now_utc())
 
-def iso_now() -> str:
-    # 向後相容（舊代碼有用到）
-    return now_iso_utc()
+# 今次執行嘅抓取時間：全部 item 共用一個（同一輪 run 抓嘅，唔使逐個 item 再攞鐘）
+FETCHED_UTC = now_utc()
+FETCHED_AT = to_iso(FETCHED_UTC)
+FETCHED_AT_LOCAL = to_iso(as_sydney(FETCHED_UTC))
+
+def item_id(key: str) -> str:
+    """item id：blake2b（16 bytes ➜ 32 位 hex，同以前 md5 長度一樣），比 md5 快"""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+_RFC_DOWS = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
 
 def normalize_date(raw: str | None) -> str | None:
     if not raw:
@@ -100,15 +130,19 @@ def normalize_date(raw: str | None) -> str | None:
         return None
     if s.endswith("Z"):
         return s
+    # ISO8601（YYYY-MM-DD...）先試；唔似 ISO 就唔好行 fromisoformat 再食 exception
+    if len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        try:
+            d = dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
+            if not d.tzinfo:
+                d = d.replace(tzinfo=dt.timezone.utc)
+            return d.astimezone(dt.timezone.utc).isoformat()
+        except Exception:
+            pass
+    # RFC822/1123（RSS pubDate："Tue, 01 Jul 2025 ..." 或 "01 Jul 2025 ..."）
+    if s[:3] not in _RFC_DOWS and not s[:1].isdigit():
+        return None
     try:
-        d = dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
-        if not d.tzinfo:
-            d = d.replace(tzinfo=dt.timezone.utc)
-        return d.astimezone(dt.timezone.utc).isoformat()
-    except Exception:
-        pass
-    try:
-        from email.utils import parsedate_to_datetime
         d = parsedate_to_datetime(s)
         if not d:
             return None
@@ -118,66 +152,113 @@ def normalize_date(raw: str | None) -> str | None:
     except Exception:
         return None
 
+def _make_session() -> requests.Session:
+    """共用 Session：全部都係 aucd.com.au，keep-alive 重用連線，唔使每個 request 再握手"""
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+SESSION = _make_session()
+
 def fetch_html(url: str) -> str | None:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+        r = SESSION.get(url, timeout=TIMEOUT)
         r.raise_for_status()
         return r.text
     except Exception:
         return None
 
-def fetch_date_from_page(url: str) -> str | None:
-    html = fetch_html(url)
-    if not html:
-        return None
+def run_parallel(fn, args: list) -> list:
+    """
+    用 thread pool 並發跑 fn(arg)，按輸入次序回結果；
+    單個失敗就喺嗰個位回 exception（由呼叫方 log）。每個 worker 做完都瞓 SLEEP 保持禮貌。
+    """
+    def call(a):
+        try:
+            return fn(a)
+        except Exception as e:
+            return e
+        finally:
+            time.sleep(SLEEP)
+    with ThreadPoolExecutor(max_workers=WORKERS) as ex:
+        return list(ex.map(call, args))
+
+_LD_JSON_RE = re.compile(r"ld\+json")
+# 文章頁只需要呢幾種 tag（meta / title / time / JSON-LD script），正文其餘 tag 唔起 tree
+_META_STRAINER = SoupStrainer(["meta", "title", "time", "script"])
+# 發佈日期 meta（按優先次序）
+_DATE_META_KEYS = (
+    ("property", "article:published_time"),
+    ("property", "og:article:published_time"),
+    ("property", "og:published_time"),
+    ("itemprop", "datePublished"),
+)
+_DATE_META_SELECTOR = ", ".join(f'meta[{a}="{v}"]' for a, v in _DATE_META_KEYS)
+
+def _scan_ld_date(data):
+    """
+    JSON-LD（dict / list / @graph）入面搵第一個發佈日期。
+    用 deque 做顯式 stack 迭代（唔遞歸；深層巢狀都唔會 RecursionError），
+    搜尋次序同以前一樣：@graph 節點先，再到本身，list 由頭到尾。
+    """
+    stack = deque([data])
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            g = o.get("@graph")
+            if isinstance(g, list):
+                for node in g:
+                    if isinstance(node, dict):
+                        d = node.get("datePublished") or node.get("uploadDate") or node.get("dateCreated")
+                        if d: return d
+            d = o.get("datePublished") or o.get("uploadDate") or o.get("dateCreated")
+            if d: return d
+        elif isinstance(o, list):
+            stack.extend(reversed(o))
+    return None
+
+def date_from_soup(soup: BeautifulSoup) -> str | None:
+    """由已 parse 嘅頁面抽發佈日期（meta → itemprop → <time> → JSON-LD）"""
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        # meta 優先
-        for key in ("article:published_time", "og:article:published_time", "og:published_time"):
-            tag = soup.find("meta", {"property": key})
-            if tag and tag.get("content"):
-                return normalize_date(tag["content"])
-        # itemprop
-        tag = soup.find("meta", attrs={"itemprop": "datePublished"})
-        if tag and tag.get("content"):
-            return normalize_date(tag["content"])
+        # meta 優先（一次 select 攞晒候選，再按 _DATE_META_KEYS 優先次序揀）
+        found = {}
+        for tag in soup.select(_DATE_META_SELECTOR):
+            content = tag.get("content")
+            if not content:
+                continue
+            for attr, val in _DATE_META_KEYS:
+                if tag.get(attr) == val:
+                    found.setdefault((attr, val), content)
+        for key in _DATE_META_KEYS:
+            if key in found:
+                return normalize_date(found[key])
         # <time datetime="...">
-        t = soup.find("time", attrs={"datetime": True})
+        t = soup.select_one("time[datetime]")
         if t and t.get("datetime"):
             return normalize_date(t["datetime"])
         # JSON-LD
-        for s in soup.find_all("script", type=lambda t: t and "ld+json" in t):
+        for s in soup.find_all("script", type=_LD_JSON_RE):
             try:
-                import json as _json
-                data = _json.loads(s.string or s.text or "")
+                data = json.loads(s.string or s.text or "")
             except Exception:
                 continue
-            def scan(o):
-                if isinstance(o, dict):
-                    if "@graph" in o and isinstance(o["@graph"], list):
-                        for g in o["@graph"]:
-                            d = g.get("datePublished") or g.get("uploadDate") or g.get("dateCreated")
-                            if d: return d
-                    d = o.get("datePublished") or o.get("uploadDate") or o.get("dateCreated")
-                    if d: return d
-                if isinstance(o, list):
-                    for each in o:
-                        got = scan(each)
-                        if got: return got
-                return None
-            d = scan(data)
+            d = _scan_ld_date(data)
             if d:
                 return normalize_date(d)
     except Exception:
         return None
     return None
 
-def extract_title_desc_from_page(url: str) -> tuple[str, str | None]:
-    html = fetch_html(url)
-    if not html:
-        return url, None
+def title_desc_from_soup(soup: BeautifulSoup, url: str) -> tuple[str, str | None]:
+    """由已 parse 嘅頁面抽標題 / 描述（og → <title> / meta description）"""
     try:
-        soup = BeautifulSoup(html, "html.parser")
         # Title
         title = None
         ogt = soup.find("meta", property="og:title")
@@ -199,26 +280,82 @@ def extract_title_desc_from_page(url: str) -> tuple[str, str | None]:
     except Exception:
         return url, None
 
+def fetch_date_from_page(url: str) -> str | None:
+    html = fetch_html(url)
+    if not html:
+        return None
+    try:
+        return date_from_soup(BeautifulSoup(html, "lxml", parse_only=_META_STRAINER))
+    except Exception:
+        return None
+
+def fetch_article_metadata(url: str) -> tuple[str, str | None, str | None]:
+    """文章頁只抓一次、parse 一次，一齊抽 (title, desc, published)"""
+    html = fetch_html(url)
+    if not html:
+        return url, None, None
+    try:
+        soup = BeautifulSoup(html, "lxml", parse_only=_META_STRAINER)
+    except Exception:
+        return url, None, None
+    title, desc = title_desc_from_soup(soup, url)
+    return title, desc, date_from_soup(soup)
+
 def candidate_feed_urls(max_pages: int) -> list[str]:
     """WordPress 常見翻頁樣式：/feed/?paged=2、/page/2/feed/、/page/2/?feed=rss2"""
-    urls = []
-    urls.append(f"{SITE}/feed/")
-    for p in range(2, max_pages + 1):
-        urls.append(f"{SITE}/feed/?paged={p}")
-        urls.append(f"{SITE}/page/{p}/feed/")
-        urls.append(f"{SITE}/page/{p}/?feed=rss2")
-    seen = set(); out = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u); out.append(u)
+    # dict.fromkeys：一次過去重兼保持次序
+    return list(dict.fromkeys(chain(
+        [f"{SITE}/feed/"],
+        (u for p in range(2, max_pages + 1) for u in (
+            f"{SITE}/feed/?paged={p}",
+            f"{SITE}/page/{p}/feed/",
+            f"{SITE}/page/{p}/?feed=rss2",
+        )),
+    )))
+
+_NS_CONTENT = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_NS_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+def _clean_summary_html(raw: str | None, base_url: str) -> str | None:
+    """
+    同 feedparser 一樣處理 HTML summary：先將相對 URL 解成絕對，再過 sanitizer
+    （剷 script / iframe / on* 屬性等），唔好將 feed 原始 HTML 直接交俾 App。
+    """
+    if not raw:
+        return None
+    return _fp_sanitize_html(_fp_resolve_uris(raw, base_url, "utf-8", "text/html"), "utf-8", "text/html")
+
+def _rss_entries_lxml(content: bytes, base_url: str) -> list[dict]:
+    """
+    WordPress RSS2 快路：lxml iterparse 逐個 <item> 抽 link / title / content:encoded /
+    description / category / pubDate，抽完即 clear，記憶體唔會隨 feed 大細增長。
+    summary 經 _clean_summary_html，輸出同 feedparser 後備一致。
+    """
+    out = []
+    for _, el in lxml_etree.iterparse(BytesIO(content), events=("end",), tag="item"):
+        link = (el.findtext("link") or "").strip()
+        cats = []
+        for c in el.iterfind("category"):
+            term = (c.text or "").strip()
+            if term and term not in cats:
+                cats.append(term)
+        out.append({
+            "link": urljoin(base_url, link) if link else "",
+            "title": (el.findtext("title") or "").strip(),
+            "summary": _clean_summary_html(el.findtext(_NS_CONTENT) or el.findtext("description"), base_url),
+            "categories": cats,
+            "published": el.findtext("pubDate") or el.findtext(_NS_DC_DATE) or None,
+        })
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
     return out
 
-def parse_feed(url: str) -> list[dict]:
-    fp = feedparser.parse(url)
-    items = []
+def _feed_entries_feedparser(content: bytes, base_url: str) -> list[dict]:
+    """後備：格式唔係預期嘅 RSS2（例如 Atom / 壞 XML）就交返 feedparser"""
+    fp = feedparser.parse(content, response_headers={"content-location": base_url})
+    out = []
     for e in fp.entries:
-        link = getattr(e, "link", "").strip()
-        title = getattr(e, "title", "").strip()
         summary = None
         if getattr(e, "content", None):
             try:
@@ -246,77 +383,141 @@ def parse_feed(url: str) -> list[dict]:
             if cat:
                 source_categories = [str(cat).strip()]
 
-        source_category = source_categories[0] if source_categories else None
-
-        published = getattr(e, "published", None) or getattr(e, "updated", None)
-        pub_norm = normalize_date(published) if published else None
-        if not pub_norm and link:
-            pub_norm = fetch_date_from_page(link)
+        out.append({
+            "link": getattr(e, "link", "").strip(),
+            "title": getattr(e, "title", "").strip(),
+            "summary": summary,
+            "categories": source_categories,
+            "published": getattr(e, "published", None) or getattr(e, "updated", None),
+        })
+    return out
 
-        # published_utc: 解析到嘅 UTC（解析失敗就用抓取時間作 fallback）
-        fetched_utc = now_utc()
-        if pub_norm:
-            try:
-                published_utc = dt.datetime.fromisoformat(pub_norm.replace("Z", "+00:00"))
-            except Exception:
-                published_utc = fetched_utc
-        else:
+def feed_entries(content: bytes, base_url: str) -> list[dict]:
+    """
+    content：已經用 SESSION 抓好嘅 RSS bytes；base_url 用嚟解相對 link。
+    喺 worker thread 跑，只抽原始 entry（link / title / summary / categories / published）；
+    各頁之間嘅去重、日期 normalize、入文補日期留返俾主線程，重複 link 唔使做。
+    """
+    entries = []
+    # 攞唔到 feedparser 嘅 sanitizer（版本改咗內部 API）就唔行快路，全交 feedparser
+    if _fp_sanitize_html is not None and _fp_resolve_uris is not None:
+        try:
+            entries = _rss_entries_lxml(content, base_url)
+        except Exception:
+            entries = []
+    if not entries:
+        entries = _feed_entries_feedparser(content, base_url)
+    return entries
+
+def item_from_entry(e: dict, pub_norm: str | None) -> dict:
+    """feed entry + 已 normalize 嘅日期（冇就 None）➜ 輸出 item"""
+    link = e["link"]
+    title = e["title"]
+    summary = e["summary"]
+    source_categories = e["categories"]
+    source_category = source_categories[0] if source_categories else None
+
+    # published_utc: 解析到嘅 UTC（解析失敗就用抓取時間作 fallback）
+    fetched_utc = FETCHED_UTC
+    if pub_norm:
+        try:
+            published_utc = dt.datetime.fromisoformat(pub_norm.replace("Z", "+00:00"))
+        except Exception:
             published_utc = fetched_utc
-        published_utc = ensure_utc(published_utc)
+    else:
+        published_utc = fetched_utc
+    published_utc = ensure_utc(published_utc)
 
-        item = {
-            "id": hashlib.md5((link or title).encode()).hexdigest(),
-            "title": title or link,
-            "link": link,
-            "summary": summary,
-            # 仍然保留 UTC 欄位（排序、比較用）
-            "publishedAt": to_iso(published_utc),
-            "fetchedAt": to_iso(fetched_utc),
-
-            # ✅ 新增：悉尼時間欄位（顯示用；自動 AEST/AEDT）
-            "publishedAtLocal": to_iso(as_sydney(published_utc)),
-            "fetchedAtLocal": to_iso(as_sydney(fetched_utc)),
-            "localTimezone": "Australia/Sydney",
-            "source": SOURCE_NAME,
-            "fetchedAt": iso_now(),
-            "sourceCategory": source_category,         # 👈 新增
-            "sourceCategories": source_categories or None,  # 👈 新增（可空）
-            "sourceSectionPath": None,                 # RSS 未必有分區 path
-        }
-        items.append(item)
+    return {
+        "id": item_id(link or title),
+        "title": title or link,
+        "link": link,
+        "summary": summary,
+        # 仍然保留 UTC 欄位（排序、比較用）
+        "publishedAt": to_iso(published_utc),
+        "fetchedAt": FETCHED_AT,
+
+        # ✅ 新增：悉尼時間欄位（顯示用；自動 AEST/AEDT）
+        "publishedAtLocal": to_iso(as_sydney(published_utc)),
+        "fetchedAtLocal": FETCHED_AT_LOCAL,
+        "localTimezone": "Australia/Sydney",
+        "source": SOURCE_NAME,
+        "sourceCategory": source_category,         # 👈 新增
+        "sourceCategories": source_categories or None,  # 👈 新增（可空）
+        "sourceSectionPath": None,                 # RSS 未必有分區 path
+    }
+    items.append(item)
     return items
 
+def load_feed_cache(path: str = FEED_CACHE_PATH) -> dict:
+    """{ feed_url: {"etag", "lastModified", "entries"} }；冇檔 / 壞檔就當空"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def save_feed_cache(cache: dict, path: str = FEED_CACHE_PATH) -> None:
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, separators=(",", ":"))
+    except Exception as e:
+        print(f"[WARN] write feed cache fail: {path}: {e}")
+
+def collect_feed(url: str, cache: dict) -> list[dict]:
+    """
+    經 SESSION 抓一頁 RSS（帶 If-None-Match / If-Modified-Since）再交俾 feed_entries。
+    伺服器回 304 就用返上次嘅 entries，唔使再傳 body 同 parse。
+    回成頁原始 entries（未去重）；唔掂共用 set，thread 之間冇 race。
+    """
+    ent = cache.get(url) or {}
+    headers = {}
+    if ent.get("entries") is not None:
+        if ent.get("etag"):
+            headers["If-None-Match"] = ent["etag"]
+        if ent.get("lastModified"):
+            headers["If-Modified-Since"] = ent["lastModified"]
+    r = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+    if r.status_code == 304 and ent.get("entries") is not None:
+        return ent["entries"]
+    if not r.ok:
+        # 同以前 feedparser.parse(url) 一樣：抓唔到就當冇 entry（翻頁 alias 好多係 404）
+        return []
+    # 快取存成頁 feed（未經去重）：下次 304 重播先唔會漏咗俾其他 alias 頁認領過嘅 link
+    entries = feed_entries(r.content, r.url or url)
+    cache[url] = {
+        "etag": r.headers.get("ETag"),
+        "lastModified": r.headers.get("Last-Modified"),
+        "entries": entries,
+    }
+    return entries
+
 # —— 分類頁抽鏈：WordPress 常見文章網址是 /YYYY/MM/.../ —— #
-DATE_PATH_RE = re.compile(r"/\d{4}/\d{2}/")
+# 一條 regex 做晒：aucd.com.au host、path 唔含非文章段、path 有 /YYYY/MM/ 或 query 有 p=
+_ARTICLE_URL_RE = re.compile(
+    r"^https?://[^/?#]*aucd\.com\.au(?=[/?#]|$)"
+    r"(?![^?#]*/(?:category|tag|page|feed|wp-json)/)"
+    r"(?:[^?#]*/\d{4}/\d{2}/|[^?#]*\?[^#]*p=)"
+)
 
 def looks_like_article_url(u: str) -> bool:
-    try:
-        p = urlparse(u)
-        if not (p.scheme in ("http","https") and p.netloc and p.netloc.endswith("aucd.com.au")):
-            return False
-        path = p.path or ""
-        # 排除非文章
-        if any(seg in path for seg in ("/category/", "/tag/", "/page/", "/feed/", "/wp-json/")):
-            return False
-        # 常見文章路徑有年份月份
-        if DATE_PATH_RE.search(path):
-            return True
-        # 兼容可能的 /?p=12345
-        if (p.query or "").find("p=") >= 0:
-            return True
-        return False
-    except Exception:
-        return False
+    # 常見文章路徑有年份月份；兼容可能的 /?p=12345；排除 category / tag / page / feed / wp-json
+    return _ARTICLE_URL_RE.match(u) is not None
 
 def extract_article_links_from_category_page(url: str) -> list[str]:
     html = fetch_html(url)
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    # 只要 <a href>：lxml XPath 直接回 href 字串 list，唔使砌 bs4 Tag
+    try:
+        hrefs = lxml_html.fromstring(html).xpath("//a/@href")
+    except Exception:
+        hrefs = [a["href"] for a in BeautifulSoup(html, "lxml").find_all("a", href=True)]
     seen, out = set(), []
     # 直接抓所有 <a> 再過濾
-    for a in soup.find_all("a", href=True):
-        u = a["href"].strip()
+    for href in hrefs:
+        u = str(href).strip()
         if not u:
             continue
         if u.startswith("/"):
@@ -343,6 +544,8 @@ def crawl_categories(category_urls: list[str], pages_each: int) -> list[tuple[st
     回傳 list of (link, sourceCategory, sourceSectionPath)
     """
     found: list[tuple[str, str | None, str | None]] = []
+    # 先列晒所有分類頁（保持次序），再一次過並發抓
+    jobs: list[tuple[str, str | None, str | None]] = []
     for base in category_urls:
         slug = _slug_from_category_url(base)
         human = CATEGORY_SLUG_MAP.get(slug) if slug else None
@@ -351,35 +554,39 @@ def crawl_categories(category_urls: list[str], pages_each: int) -> list[tuple[st
             f"{base.rstrip('/')}/page/{i}/" for i in range(2, pages_each + 1)
         ]
         for pg in pages:
-            links = extract_article_links_from_category_page(pg)
-            for link in links:
-                found.append((link, human, "/category/" + (slug or "" ) + "/"))
-            time.sleep(SLEEP)
-    # 去重保持順序（按 link）
-    seen = set(); uniq = []
-    for link, cat, sec in found:
-        if link in seen: 
+            jobs.append((pg, human, "/category/" + (slug or "" ) + "/"))
+    results = run_parallel(extract_article_links_from_category_page, [pg for pg, _, _ in jobs])
+    for (pg, human, sec), links in zip(jobs, results):
+        if isinstance(links, Exception):
+            print(f"[WARN] category page fail: {pg}: {links}")
             continue
-        seen.add(link); uniq.append((link, cat, sec))
-    return uniq
+        for link in links:
+            found.append((link, human, sec))
+    # 去重保持順序（按 link；同一 link 以第一次出現嘅分類為準）
+    first: dict[str, tuple[str, str | None, str | None]] = {}
+    for job in found:
+        first.setdefault(job[0], job)
+    return list(first.values())
 
 def make_item_from_article(url: str, source_category: str | None, source_section_path: str | None) -> dict:
-    title, desc = extract_title_desc_from_page(url)
-    pub = fetch_date_from_page(url)
+    title, desc, pub = fetch_article_metadata(url)
     return {
-        "id": hashlib.md5((url or title).encode()).hexdigest(),
+        "id": item_id(url or title),
         "title": title or url,
         "link": url,
         "summary": desc,
         "publishedAt": pub,
         "source": SOURCE_NAME,
-        "fetchedAt": iso_now(),
+        "fetchedAt": FETCHED_AT,
         "sourceCategory": source_category,                 # 👈 由分類 URL 推斷
         "sourceCategories": [source_category] if source_category else None,
         "sourceSectionPath": source_section_path,          # 👈 例如 /category/financial-news/
     }
 
-def merge_dedupe(all_items: list[dict]) -> list[dict]:
+_MIN_UTC = dt.datetime.min.replace(tzinfo=dt.timezone.utc)
+
+def merge_dedupe(all_items: list[dict], limit: int | None = None) -> list[dict]:
+    """按 link 去重，再按日期 desc 排；有 limit 就用 heap 只揀頭 limit 個（唔使全部排序）"""
     seen = set()
     out = []
     for it in all_items:
@@ -388,14 +595,17 @@ def merge_dedupe(all_items: list[dict]) -> list[dict]:
             continue
         seen.add(key); out.append(it)
     # 按日期 desc（冇日期放後）
+    # RSS 嗰邊以 Z 結尾、入文嗰邊係 +00:00，字串比唔準；parse 返 UTC datetime 先比
     def key_dt(it):
         s = it.get("publishedAt")
         if not s:
-            return dt.datetime.min.replace(tzinfo=dt.timezone.utc)
+            return (0, _MIN_UTC)
         try:
-            return dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
+            return (1, ensure_utc(dt.datetime.fromisoformat(s.replace("Z", "+00:00"))))
         except Exception:
-            return dt.datetime.min.replace(tzinfo=dt.timezone.utc)
+            return (0, _MIN_UTC)
+    if limit is not None:
+        return heapq.nlargest(limit, out, key=key_dt)
     out.sort(key=key_dt, reverse=True)
     return out
 
@@ -409,32 +619,57 @@ def json_out(items: list[dict], path: str):
         "count": len(items),
         "items": items
     }
+    if orjson is not None:
+        # orjson 直接出 UTF-8 bytes（等同 ensure_ascii=False）
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
 if __name__ == "__main__":
     bag = []
-
-    # A) RSS 多頁
-    for u in candidate_feed_urls(MAX_PAGES):
-        try:
-            bag.extend(parse_feed(u))
-        except Exception as e:
-            print(f"[WARN] parse fail: {u}: {e}")
-        time.sleep(SLEEP)
+    seen: set[str] = set()  # RSS 同分類頁共用：見過嘅 link 唔再處理
+    feed_cache = load_feed_cache()
+
+    # A) RSS 多頁（並發抓，按原本次序合併；冇變嘅頁 304 直接用返快取）
+    feed_urls = candidate_feed_urls(MAX_PAGES)
+    # 各頁喺 worker 抓同抽 entry；去重喺主線程按 feed 次序做，邊頁認領 link 唔靠 thread 時序
+    new_entries = []
+    for u, res in zip(feed_urls, run_parallel(lambda u: collect_feed(u, feed_cache), feed_urls)):
+        if isinstance(res, Exception):
+            print(f"[WARN] parse fail: {u}: {res}")
+            continue
+        for e in res:
+            link = e.get("link")
+            if link:
+                if link in seen:
+                    continue
+                seen.add(link)
+            new_entries.append(e)
+    # 只為新 link normalize 日期；RSS 冇日期先入文補（並發）
+    pubs = [normalize_date(e["published"]) if e.get("published") else None for e in new_entries]
+    need = [i for i, (e, p) in enumerate(zip(new_entries, pubs)) if not p and e.get("link")]
+    for i, got in zip(need, run_parallel(fetch_date_from_page, [new_entries[i]["link"] for i in need])):
+        if not isinstance(got, Exception):
+            pubs[i] = got
+    bag.extend(item_from_entry(e, p) for e, p in zip(new_entries, pubs))
 
     # B) 分類頁逐頁抽連 + 入文補資料（帶 sourceCategory / sourceSectionPath）
     cat_links = crawl_categories(CATEGORY_URLS, CATEGORY_PAGES)
-    for link, cat, sec in cat_links:
-        try:
-            item = make_item_from_article(link, cat, sec)
-            bag.append(item)
-        except Exception as e:
-            print(f"[WARN] article parse fail: {link}: {e}")
-        time.sleep(SLEEP)
+    # RSS 已經有嘅 link 唔使再入文抓（merge_dedupe 反正會保留 RSS 嗰份）
+    cat_links = [job for job in cat_links if job[0] not in seen]
+    results = run_parallel(lambda job: make_item_from_article(*job), cat_links)
+    for (link, cat, sec), item in zip(cat_links, results):
+        if isinstance(item, Exception):
+            print(f"[WARN] article parse fail: {link}: {item}")
+            continue
+        bag.append(item)
+
+    save_feed_cache(feed_cache)
 
     # C) 合併去重 & 截頂
-    merged = merge_dedupe(bag)[:MAX_ITEMS]
+    merged = merge_dedupe(bag, MAX_ITEMS)
     json_out(merged, "aucd.json")
     print(f"[DONE] AUCD items: {len(merged)}")
 
@@ -1,19 +1,43 @@
 # workers/scrape_sbs_en.py
-import json, re, sys, html, hashlib, time
+import json, re, sys, html, hashlib, time, threading, math
 from datetime import datetime, timezone
-from urllib.parse import urlparse, parse_qs, unquote, urljoin
+from urllib.parse import urlparse, parse_qs, parse_qsl, unquote, urljoin, urlencode
+from functools import lru_cache
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from collections import deque
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound
 from xml.etree import ElementTree as ET
 from zoneinfo import ZoneInfo
 
+try:
+    from lxml import html as LH    # 淨係要連結嘅頁：XPath 直接攞 href，唔使砌 soup
+    from lxml import etree as LET  # sitemap 串流解析；冇裝就用 ElementTree
+except Exception:
+    LH = LET = None
+
+try:
+    import orjson  # 快好多嘅 JSON parse / 序列化；冇裝就用返 json
+except Exception:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # ---------------- 基本設定 ----------------
 HEADERS = {"User-Agent": "HKersInOZBot/1.0 (+news-aggregator; contact: you@example.com)"}
 TIMEOUT = 25
 MAX_ITEMS = 200            # 要 200
-FETCH_SLEEP = 0.5          # 抓單篇之間小睡，對站方友善
+FETCH_SLEEP = 0.5          # 同一 host 兩個請求起步最少相隔幾秒，對站方友善
+FETCH_WORKERS = 8          # 併發抓頁 thread 數
+PER_HOST_LIMIT = 2         # 同一 host 最多同時幾個請求（politeness）
+CACHE_PATH = "sbs_en_cache.json"   # 上次抓過嘅文章：ETag / Last-Modified + item（conditional GET 用）
+CACHE_MAX_AGE_DAYS = 7
 
 SBS_HOST = "www.sbs.com.au"
 ROBOTS_URL = "https://www.sbs.com.au/robots.txt"
@@ -50,8 +74,14 @@ GN_URL = (
 def iso_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+_WS = re.compile(r"\s+")
+
 def clean(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS.sub(" ", (s or "")).strip()
+
+def item_id(key: str) -> str:
+    """item id：blake2b（16 bytes ➜ 32 位 hex，同以前 md5 長度一樣），比 md5 快"""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
 
 def to_iso(dt: datetime) -> str:
     """確保 datetime 轉成 ISO8601（含偏移）"""
@@ -69,41 +99,46 @@ def as_sydney(dt_utc: datetime | None) -> datetime | None:
         return None
     return dt_utc.astimezone(SYD)
 
+# ISO8601 形狀（YYYY-MM-DD[T ]HH:MM[:SS][.fff][ ][Z|±HH:MM]）；中咗先交 fromisoformat（C 實作）
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:\s?(?:Z|[+-]\d{2}:?\d{2}))?)?$")
+_ISO_OFFSET_SPACE_RE = re.compile(r"\s+(?=(?:Z|[+-]\d{2}:?\d{2})$)")
+
+def _from_iso(s: str) -> datetime | None:
+    try:
+        dt = datetime.fromisoformat(_ISO_OFFSET_SPACE_RE.sub("", s))
+    except Exception:
+        return None
+    return dt.replace(tzinfo=timezone.utc) if not dt.tzinfo else dt
+
+def _from_rfc822(s: str) -> datetime | None:
+    try:
+        dt = parsedate_to_datetime(s)
+    except Exception:
+        return None
+    if not dt:
+        return None
+    return dt.replace(tzinfo=timezone.utc) if not dt.tzinfo else dt
+
+@lru_cache(maxsize=4096)
 def normalize_date(raw: str | None) -> str | None:
-    """標準化常見日期格式為 UTC ISO8601。"""
+    """
+    標準化常見日期格式為 UTC ISO8601（一律 +00:00 結尾，同 fetchedAt 一致）。
+    同一批文章嘅日期字串好多重複，lru_cache 記住結果。
+    """
     if not raw:
         return None
     s = raw.strip()
     if not s:
         return None
-    # 已是 UTC Z
-    if s.endswith("Z"):
-        return s
-    # ISO 8601 與帶時區
-    try:
-        dt = None
-        try:
-            dt = datetime.fromisoformat(s.replace("Z", ""))
-        except Exception:
-            dt = None
-        if dt:
-            if not dt.tzinfo:
-                dt = dt.replace(tzinfo=timezone.utc)
+    # 形狀只係揀邊個 parser 先試（ISO 或 RFC822/1123）；第一個唔得就試另一個，唔會直接放棄
+    parsers = (_from_iso, _from_rfc822) if _ISO_RE.match(s) else (_from_rfc822, _from_iso)
+    for parse in parsers:
+        dt = parse(s)
+        if dt is not None:
             return dt.astimezone(timezone.utc).isoformat()
-    except Exception:
-        pass
-    # RFC822/1123 後備
-    try:
-        from email.utils import parsedate_to_datetime
-        dt = parsedate_to_datetime(s)
-        if not dt:
-            return None
-        if not dt.tzinfo:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc).isoformat()
-    except Exception:
-        return None
+    return None
 
+@lru_cache(maxsize=4096)
 def parse_iso_dt(s: str | None) -> datetime | None:
     """ISO8601 字串（可含/不含 Z）→ aware datetime（UTC）"""
     if not s:
@@ -116,11 +151,146 @@ def parse_iso_dt(s: str | None) -> datetime | None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
-def fetch(url: str) -> requests.Response:
-    r = requests.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+def make_soup(html_text: str) -> BeautifulSoup:
+    """
+    HTML ➜ soup：用 lxml 做 builder（C parser，快過 html.parser 好多）；
+    冇裝 lxml 先退返 html.parser。每頁只 parse 一次，soup 傳落去各 helper 共用。
+    """
+    try:
+        return BeautifulSoup(html_text, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html_text, "html.parser")
+
+def _as_soup(doc) -> BeautifulSoup:
+    """接受 HTML 字串或已 parse 好嘅 soup"""
+    return make_soup(doc) if isinstance(doc, (str, bytes)) else doc
+
+def _make_session() -> requests.Session:
+    """共用 Session：keep-alive 重用連線（差唔多全部都係 www.sbs.com.au），唔使每個 request 再握手 TLS"""
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+SESSION = _make_session()
+
+def fetch(url: str, headers: dict | None = None) -> requests.Response:
+    r = SESSION.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True)
     r.raise_for_status()
     return r
 
+# ---------------- 併發抓取（每 host 限流） ----------------
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        sem = _HOST_SLOTS.get(host)
+        if sem is None:
+            sem = _HOST_SLOTS[host] = threading.BoundedSemaphore(PER_HOST_LIMIT)
+    return sem
+
+_NEXT_HIT: dict[str, float] = {}   # host ➜ 下一個請求最早可以幾時起步（monotonic）
+_NEXT_HIT_LOCK = threading.Lock()
+
+def _wait_turn(url: str) -> None:
+    """按 host 排期：同 host 請求起步相隔 FETCH_SLEEP；唔同 host 互不拖慢"""
+    host = urlparse(url).netloc
+    with _NEXT_HIT_LOCK:
+        now = time.monotonic()
+        start = max(now, _NEXT_HIT.get(host, 0.0))
+        _NEXT_HIT[host] = start + FETCH_SLEEP
+    if start > now:
+        time.sleep(start - now)
+
+def polite_fetch(url: str, headers: dict | None = None) -> requests.Response:
+    """同 host 最多 PER_HOST_LIMIT 個請求同時進行，起步按 host 排隊相隔 FETCH_SLEEP"""
+    with _host_slot(url):
+        _wait_turn(url)
+        return fetch(url, headers=headers)
+
+def _attempt(fn, url):
+    try:
+        return fn(url), None
+    except Exception as e:
+        return None, e
+
+def fetch_many(urls: list[str], fn=None, workers: int = FETCH_WORKERS):
+    """
+    用 thread pool 併發做 fn(url)（預設：抓頁返 text），按輸入次序 yield (url, result, error)。
+    fn 喺 worker 入面跑，parse 都可以一齊併發。呼叫方中途 break 就取消未開始嘅。
+    """
+    fn = fn or (lambda u: polite_fetch(u).text)
+    if not urls:
+        return
+    ex = ThreadPoolExecutor(max_workers=min(workers, len(urls)))
+    try:
+        for u, (res, err) in zip(urls, ex.map(lambda u: _attempt(fn, u), urls)):
+            yield u, res, err
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+# ---------------- URL 去重 ----------------
+# canonical_url 會剷走嘅 query（全部細楷比較；utm_* 另外處理）
+_DROP_QUERY_KEYS = frozenset({"fbclid", "gclid", "_", "cb"})
+
+@lru_cache(maxsize=8192)
+def canonical_url(u: str) -> str:
+    """
+    URL 正規化（去重 key 兼抓取用）：
+      - SBS 一律 https://www.sbs.com.au
+      - 移除 fragment、tracking query（utm_*、fbclid、gclid、cache-buster）
+      - 餘下 query 排序；去走結尾斜線
+    非 http(s) 連結原樣回傳。
+    """
+    try:
+        p = urlparse(u)
+        if p.scheme not in ("http", "https"):
+            return u
+        netloc = p.netloc.lower()
+        scheme = p.scheme
+        if netloc.endswith("sbs.com.au"):
+            scheme, netloc = "https", SBS_HOST
+        q = sorted(
+            (k, v) for k, v in parse_qsl(p.query)
+            if not k.lower().startswith("utm_") and k.lower() not in _DROP_QUERY_KEYS
+        )
+        path = p.path.rstrip("/") or "/"
+        return f"{scheme}://{netloc}{path}" + (f"?{urlencode(q)}" if q else "")
+    except Exception:
+        return u
+
+class BloomFilter:
+    """
+    細細個 bloom filter（bytearray 做 bit array；blake2b 雙雜湊出 k 個位置）。
+    每條 URL 大約 20–30 bit，比 set[str] 逐條存字串慳好多；誤判率 error_rate（只會多 skip 一條）。
+    """
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.k = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        for i in range(self.k):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
 # ---------------- Category 判斷（URL 優先） ----------------
 def _slug_title(slug: str) -> str:
     m = {
@@ -140,6 +310,7 @@ def _slug_title(slug: str) -> str:
     # fallback: Title Case by hyphen
     return " ".join(w.capitalize() for w in slug.split("-") if w)
 
+@lru_cache(maxsize=8192)
 def category_from_url(u: str) -> str | None:
     try:
         p = urlparse(u)
@@ -155,7 +326,7 @@ def category_from_url(u: str) -> str | None:
     return None
 
 # ---------------- JSON-LD / meta 解析 ----------------
-def parse_json_ld(html_text: str):
+def parse_json_ld(doc):
     """
     由 JSON-LD 取標題/描述/日期/url/分類。
     支援: NewsArticle / Article / BlogPosting / PodcastEpisode / AudioObject。
@@ -163,120 +334,140 @@ def parse_json_ld(html_text: str):
       datePublished > uploadDate > dateCreated > dateModified
     """
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
+        soup = _as_soup(doc)
         for tag in soup.find_all("script", type=lambda t: t and "ld+json" in t):
-            txt = tag.string or tag.get_text() or ""
+            # NavigableString 係 str 子類，orjson 唔收，要轉返純 str
+            txt = str(tag.string or tag.get_text() or "")
             try:
-                data = json.loads(txt)
+                data = _json_loads(txt)
             except Exception:
                 continue
-
-            def select(obj: dict) -> dict | None:
-                if not isinstance(obj, dict):
-                    return None
-                t = obj.get("@type")
-                if isinstance(t, list):
-                    t = next((x for x in t if isinstance(x, str)), None)
-                if t not in ("NewsArticle", "Article", "BlogPosting", "PodcastEpisode", "AudioObject"):
-                    return None
-                date = (
-                    obj.get("datePublished")
-                    or obj.get("uploadDate")
-                    or obj.get("dateCreated")
-                    or obj.get("dateModified")
-                    or ""
-                )
-                # 分類（可能在 articleSection）
-                section = obj.get("articleSection")
-                if isinstance(section, list):
-                    section = next((x for x in section if isinstance(x, str)), None)
-                return {
-                    "headline": obj.get("headline") or obj.get("name") or "",
-                    "description": obj.get("description") or "",
-                    "datePublished": date,
-                    "url": obj.get("url") or "",
-                    "articleSection": section or "",
-                }
-
-            # 掃描物件 / 陣列 / @graph
-            def scan(o):
-                if isinstance(o, dict):
-                    if "@graph" in o and isinstance(o["@graph"], list):
-                        for g in o["@graph"]:
-                            got = select(g)
-                            if got:
-                                return got
-                    got = select(o)
-                    if got:
-                        return got
-                if isinstance(o, list):
-                    for each in o:
-                        got = scan(each)
-                        if got:
-                            return got
-                return None
-
-            candidate = scan(data)
+            candidate = _scan_ld(data)
             if candidate:
                 return candidate
     except Exception:
         pass
     return {}
 
-def extract_meta_from_html(html_text: str):
-    soup = BeautifulSoup(html_text, "html.parser")
-    title = (soup.find("meta", property="og:title") or {}).get("content") \
-        or (soup.title.string if soup.title else "") \
-        or ""
-    desc = (soup.find("meta", property="og:description") or {}).get("content") \
-        or (soup.find("meta", attrs={"name": "description"}) or {}).get("content") \
+_WANTED_TYPES = frozenset({"NewsArticle", "Article", "BlogPosting", "PodcastEpisode", "AudioObject"})
+
+def _ld_select(obj: dict) -> dict:
+    date = (
+        obj.get("datePublished")
+        or obj.get("uploadDate")
+        or obj.get("dateCreated")
+        or obj.get("dateModified")
         or ""
-    pub = (
-        (soup.find("meta", property="article:published_time") or {}).get("content")
-        or (soup.find("meta", property="og:article:published_time") or {}).get("content")
-        or (soup.find("meta", property="og:published_time") or {}).get("content")
-        or (soup.find("meta", attrs={"itemprop": "datePublished"}) or {}).get("content")
-        or (soup.find("meta", attrs={"itemprop": "uploadDate"}) or {}).get("content")
-        or (soup.find("meta", attrs={"name": "date"}) or {}).get("content")
-        or None
     )
+    # 分類（可能在 articleSection）
+    section = obj.get("articleSection")
+    if isinstance(section, list):
+        section = next((x for x in section if isinstance(x, str)), None)
+    return {
+        "headline": obj.get("headline") or obj.get("name") or "",
+        "description": obj.get("description") or "",
+        "datePublished": date,
+        "url": obj.get("url") or "",
+        "articleSection": section or "",
+    }
+
+def _scan_ld(data) -> dict | None:
+    """
+    掃描物件 / 陣列 / @graph：用 stack 代替遞歸，撞到第一個合資格 @type 即刻返。
+    Organization / BreadcrumbList 之類唔會再逐層 call 落去。
+    """
+    stack = [data]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            t = o.get("@type")
+            if isinstance(t, list):
+                t = next((x for x in t if isinstance(x, str)), None)
+            if t in _WANTED_TYPES:
+                return _ld_select(o)
+            g = o.get("@graph")
+            if isinstance(g, list):
+                stack.extend(reversed(g))
+        elif isinstance(o, list):
+            stack.extend(reversed(o))
+    return None
+
+def _meta_map(soup) -> dict[str, str]:
+    """一次過掃晒 <meta>：property / name / itemprop ➜ content（同名取第一個）"""
+    out: dict[str, str] = {}
+    for m in soup.find_all("meta", content=True):
+        for attr in ("property", "name", "itemprop"):
+            key = m.get(attr)
+            if key and key not in out:
+                out[key] = m["content"]
+    return out
+
+_PUB_META_KEYS = (
+    "article:published_time", "og:article:published_time", "og:published_time",
+    "datePublished", "uploadDate", "date",
+)
+
+def extract_meta_from_html(doc, meta: dict[str, str] | None = None):
+    soup = _as_soup(doc)
+    meta = _meta_map(soup) if meta is None else meta
+    title = meta.get("og:title") \
+        or (soup.title.string if soup.title else "") \
+        or ""
+    desc = meta.get("og:description") or meta.get("description") or ""
+    pub = next((meta[k] for k in _PUB_META_KEYS if meta.get(k)), None)
     # <time datetime="...">
     if not pub:
         t = soup.find("time", attrs={"datetime": True})
         if t and t.get("datetime"):
             pub = t["datetime"]
     # Section 後備
-    section = (
-        (soup.find("meta", property="article:section") or {}).get("content")
-        or (soup.find("meta", attrs={"name": "section"}) or {}).get("content")
-        or ""
-    )
+    section = meta.get("article:section") or meta.get("section") or ""
     return clean(title), clean(desc), pub, (section or None)
 
-def make_item(url: str, html_text: str, hint_section: str | None = None):
-    # 1) URL 優先
-    section = category_from_url(url) or hint_section
+def _page_hrefs(soup, base: str) -> list[str]:
+    """頁內所有 <a href>（已 urljoin 成絕對 URL）"""
+    return [urljoin(base, a["href"]) for a in soup.find_all("a", href=True)]
+
+@dataclass
+class ParsedPage:
+    """文章頁 parse 一次嘅結果（title / desc 已 clean 過，下游唔使再 clean）"""
+    title: str | None
+    desc: str
+    pub: str | None            # 已 normalize 嘅 UTC ISO
+    section: str | None        # JSON-LD / meta 嘅分類（唔計 URL）
 
-    # 2) 內容頁解析（日期 + 可能的分類後備）
-    ld = parse_json_ld(html_text)
+def parse_page(html_text: str) -> ParsedPage:
+    """
+    一個 soup 做晒：JSON-LD ➜（冇標題先）meta 一次掃晒 <meta>。
+    文章頁唔使連結；巡航頁行 links_from_html_anywhere（XPath）。
+    """
+    soup = make_soup(html_text)
+    ld = parse_json_ld(soup)
+    title = pub = section = None
+    desc = ""
     if ld:
-        title = clean(ld.get("headline", "")) or None
-        desc = clean(ld.get("description", "")) or ""
+        title = clean(ld.get("headline")) or None
+        desc = clean(ld.get("description"))
         pub = normalize_date(ld.get("datePublished") or None)
-        section = section or (ld.get("articleSection") or None)
-        if not title:
-            t2, d2, p2, s2 = extract_meta_from_html(html_text)
-            title = t2; desc = desc or d2; pub = pub or normalize_date(p2); section = section or s2
-    else:
-        t2, d2, p2, s2 = extract_meta_from_html(html_text)
-        title = t2; desc = d2; pub = normalize_date(p2); section = section or s2
+        section = ld.get("articleSection") or None
+    if not title:
+        # 同一個 soup；extract_meta_from_html 出嚟已經 clean 過
+        t2, d2, p2, s2 = extract_meta_from_html(soup)
+        title = t2; desc = desc or d2; pub = pub or normalize_date(p2); section = section or s2
+    return ParsedPage(title=title, desc=desc, pub=pub, section=section)
+
+def make_item(url: str, html_text: str, hint_section: str | None = None):
+    # 1) URL 優先；2) 內容頁解析（日期 + 可能的分類後備），只 parse 一次
+    page = parse_page(html_text)
+    section = category_from_url(url) or hint_section or page.section
+    title, desc, pub = page.title, page.desc, page.pub
 
     # 轉回 datetime 以便產出本地時間欄位
     pub_dt_utc = parse_iso_dt(pub) if pub else None
     fetched_dt_utc = datetime.now(timezone.utc)
 
     return {
-        "id": hashlib.md5(url.encode()).hexdigest(),
+        "id": item_id(url),
         "title": title or url,
         "link": url,
         "summary": desc,
@@ -295,6 +486,7 @@ def make_item(url: str, html_text: str, hint_section: str | None = None):
 
 # ---------------- A) robots.txt ➜ 所有 sitemap ----------------
 SITEMAP_RE = re.compile(r"(?im)^\s*Sitemap:\s*(https?://\S+)\s*$")
+LOC_RE = re.compile(r"<loc>\s*(.*?)\s*</loc>")
 
 def sitemaps_from_robots() -> list[str]:
     try:
@@ -304,69 +496,107 @@ def sitemaps_from_robots() -> list[str]:
         return []
     return SITEMAP_RE.findall(txt)
 
-def parse_sitemap_urls(xml_text: str) -> list[str]:
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+SM_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+def iter_sitemap_locs(content: bytes):
+    """
+    lxml iterparse：逐個 <loc> yield（url / sitemap 都係 loc），用完即 clear 兼剷走前面兄弟，
+    大 sitemap 都唔使成棵樹留喺記憶體，亦唔使 findall 行兩次。
+    """
+    for _, el in LET.iterparse(BytesIO(content), events=("end",), tag="{%s}loc" % SM_NS):
+        if el.text:
+            yield el.text.strip()
+        el.clear()
+        parent = el.getparent()
+        if parent is not None:
+            while parent.getprevious() is not None:
+                del parent.getparent()[0]
+
+def parse_sitemap_urls(xml: bytes | str) -> list[str]:
+    ns = {"sm": SM_NS}
+    if isinstance(xml, str):
+        xml = xml.encode("utf-8")
+    if LET is not None:
+        try:
+            return list(iter_sitemap_locs(xml))
+        except Exception:
+            pass
     urls = []
     try:
-        root = ET.fromstring(xml_text)
+        root = ET.fromstring(xml)
         for loc in root.findall(".//sm:url/sm:loc", ns):
             if loc.text: urls.append(loc.text.strip())
         for loc in root.findall(".//sm:sitemap/sm:loc", ns):
             if loc.text: urls.append(loc.text.strip())
     except ET.ParseError:
-        urls = [m.group(1) for m in re.finditer(r"<loc>\s*(.*?)\s*</loc>", xml_text)]
+        urls = LOC_RE.findall(xml.decode("utf-8", "replace"))
     return urls
 
 def collect_from_sitemaps() -> list[str]:
     all_sitemaps = sitemaps_from_robots()
     out = []
-    for sm in all_sitemaps:
-        if not sm.lower().endswith(".xml"):
-            continue
+    xml_sitemaps = [sm for sm in all_sitemaps if sm.lower().endswith(".xml")]
+    # 併發抓（I/O），按次序逐個 parse；直接交 bytes 落 iterparse，唔使先 decode 成大 str
+    for sm, content, err in fetch_many(xml_sitemaps, lambda sm: fetch(sm).content):
         try:
-            xml = fetch(sm).text
-            urls = parse_sitemap_urls(xml)
+            if err is not None:
+                raise err
+            urls = parse_sitemap_urls(content)
             for u in urls:
                 # 目標：英語新聞/節目文章
                 if "/news/" in u and any(seg in u for seg in ("/article/", "/podcast-episode/", "/story/")):
-                    out.append(u)
+                    out.append(canonical_url(u))
         except Exception as e:
             print(f"[WARN] sitemap fail {sm}: {e}", file=sys.stderr)
             continue
         if len(out) >= 12 * MAX_ITEMS:
             break
-    # 去重
-    seen = set(); uniq = []
+    # 去重（sitemap 可以好長；bloom 代替 set，誤判率壓到 1e-6）
+    seen = BloomFilter(capacity=max(10_000, len(out)), error_rate=1e-6); uniq = []
     for u in out:
         if u not in seen:
             seen.add(u); uniq.append(u)
     return uniq
 
 # ---------------- B) 入口頁抽 link（含 script/JSON） ----------------
+# 絕對 + 相對文章 URL 合併成一條 regex，每頁原始 HTML 只掃一次
 ARTICLE_HREF_RE = re.compile(
-    r'https?://www\.sbs\.com\.au/news/(?:article|story|podcast-episode)/[A-Za-z0-9\-/_]+'
-)
-REL_ARTICLE_RE = re.compile(
-    r'/news/(?:article|story|podcast-episode)/[A-Za-z0-9\-/_]+'
+    r'(?:https?://www\.sbs\.com\.au)?/news/(?:article|story|podcast-episode)/[A-Za-z0-9\-/_]+'
 )
 
-def links_from_html_anywhere(html_text: str, base: str) -> list[str]:
+def _article_links(html_text: str, base: str, hrefs: list[str]) -> list[str]:
     links = set()
-    soup = BeautifulSoup(html_text, "html.parser")
     # 1) <a>
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.startswith("/"):
-            href = urljoin(base, href)
+    for href in hrefs:
         if "/news/" in href and any(seg in href for seg in ("/article/", "/story/", "/podcast-episode/")):
-            links.add(href)
-    # 2) script/JSON 文字內的 URL
+            links.add(canonical_url(href))
+    # 2) script/JSON 文字內的 URL（相對路徑補返 host；絕對 URL urljoin 原樣返）
     for m in ARTICLE_HREF_RE.finditer(html_text):
-        links.add(m.group(0))
-    for m in REL_ARTICLE_RE.finditer(html_text):
-        links.add(urljoin(base, m.group(0)))
+        links.add(canonical_url(urljoin(base, m.group(0))))
     return list(links)
 
+def _hrefs_fast(html_text: str, base: str) -> list[str]:
+    """
+    頁內所有 <a href>：有 lxml 就 //a/@href（C 層迭代，唔包 Tag 物件），否則退返 soup。
+    """
+    if LH is not None:
+        try:
+            try:
+                doc = LH.document_fromstring(html_text)
+            except ValueError:
+                # 帶 <?xml encoding=...?> 聲明嘅 str lxml 唔收，轉返 bytes
+                doc = LH.document_fromstring(html_text.encode("utf-8"))
+            return [urljoin(base, h) for h in doc.xpath("//a/@href")]
+        except Exception:
+            pass
+    return _page_hrefs(make_soup(html_text), base)
+
+def links_from_html_anywhere(html_text: str, base: str) -> tuple[list[str], list[str]]:
+    """一次 parse：回傳 (文章連結, 頁內所有 href)；BFS 直接用第二個入隊"""
+    hrefs = _hrefs_fast(html_text, base)
+    return _article_links(html_text, base, hrefs), hrefs
+
+@lru_cache(maxsize=256)
 def category_from_entry_base(base: str) -> str | None:
     """由入口 base URL 推斷該入口對應的 Category（hint）"""
     try:
@@ -378,40 +608,46 @@ def category_from_entry_base(base: str) -> str | None:
         pass
     return None
 
-def collect_from_entrypages() -> dict[str, str | None]:
+def collect_from_entrypages() -> tuple[dict[str, str | None], dict[str, str]]:
     """
     對每個入口 + 分頁候選頁抓連結，並帶上入口推斷的 category hint。
-    回傳：{ article_url: category_hint_or_None }
+    回傳：({ article_url: category_hint_or_None }, { entry_url: html })
+    第二個俾 crawl_news_section 做 prefetched，入口頁唔使再抓一次。
     """
     out: dict[str, str | None] = {}
-    for base in ENTRY_BASES:
-        hint = category_from_entry_base(base)
-        try:
-            # 只抓入口首頁；不再嘗試分頁
-            html_text = fetch(base).text
-            for u in links_from_html_anywhere(html_text, base=base):
-                if u not in out:
-                    out[u] = hint
-        except Exception as e:
-            print(f"[WARN] entry scrape fail {base}: {e}", file=sys.stderr)
+    seed_html: dict[str, str] = {}
+    # 只抓入口首頁；不再嘗試分頁。4 條 thread 併發，同 host 仍受 PER_HOST_LIMIT 限
+    for base, html_text, err in fetch_many(ENTRY_BASES, workers=4):
+        if err is not None:
+            print(f"[WARN] entry scrape fail {base}: {err}", file=sys.stderr)
             continue
-        time.sleep(0.2)
-    return out
+        seed_html[base] = html_text
+        hint = category_from_entry_base(base)
+        for u in links_from_html_anywhere(html_text, base=base)[0]:
+            if u not in out:
+                out[u] = hint
+    return out, seed_html
 
 # ---------------- C) 英文新聞區淺層 BFS 爬（擴大覆蓋） ----------------
+# 媒體檔（path 結尾或緊接 query）；一次 search 代替逐個 `in`
+_MEDIA_RE = re.compile(r"\.(?:mp3|mp4|jpe?g|png|gif)(?:\?|$)", re.I)
+
 def should_visit(url: str) -> bool:
     if not url.startswith(SECTION_ALLOWED_PREFIXES):
         return False
-    if any(x in url for x in [".mp3", ".mp4", ".jpg", ".jpeg", ".png", ".gif"]):
-        return False
-    return True
+    return not _MEDIA_RE.search(url)
 
-def crawl_news_section(seeds: list[str], max_pages: int = 120) -> list[str]:
+def crawl_news_section(seeds: list[str], max_pages: int = 120,
+                       prefetched: dict[str, str] | None = None) -> list[str]:
     """
-    用 BFS 擴大覆蓋；從入口 seeds（已含分頁候選）開始
+    用 BFS 擴大覆蓋；從入口 seeds（已含分頁候選）開始。
+    每輪由隊頭攞最多 FETCH_WORKERS 頁一齊抓，結果按原次序處理，BFS 次序不變。
+    prefetched：已經抓過嘅頁（入口頁）{url: html}，直接用，唔再 request。
     """
+    prefetched = prefetched or {}
     q = deque()
-    seen_pages = set()
+    # 已入隊嘅頁：每頁幾百條 href，用 bloom filter 代替 set 保持記憶體平穩（誤判只係少巡一頁）
+    seen_pages = BloomFilter(capacity=max(10_000, max_pages * 500))
     found_articles = set()
 
     for s in seeds:
@@ -420,39 +656,39 @@ def crawl_news_section(seeds: list[str], max_pages: int = 120) -> list[str]:
 
     pages_visited = 0
     while q and pages_visited < max_pages:
-        url = q.popleft()
-        try:
-            html_text = fetch(url).text
-        except Exception as e:
-            print(f"[WARN] crawl fetch fail {url}: {e}", file=sys.stderr)
-            continue
-
-        # 1) 抽文章 + podcast-episode link
-        for art in links_from_html_anywhere(html_text, base=url):
-            found_articles.add(art)
-
-        # 2) 將頁面內可巡航 link 入隊
-        soup = BeautifulSoup(html_text, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if href.startswith("/"):
-                href = urljoin(url, href)
-            if not href or href in seen_pages:
+        batch = [q.popleft() for _ in range(min(len(q), FETCH_WORKERS, max_pages - pages_visited))]
+        todo = [u for u in batch if u not in prefetched]
+        fetched = {u: (h, e) for u, h, e in fetch_many(todo)}
+        for url in batch:
+            html_text, err = (prefetched[url], None) if url in prefetched else fetched[url]
+            if err is not None:
+                print(f"[WARN] crawl fetch fail {url}: {err}", file=sys.stderr)
                 continue
-            if should_visit(href):
-                seen_pages.add(href)
-                q.append(href)
 
-        pages_visited += 1
-        time.sleep(FETCH_SLEEP)
+            # 1) 抽文章 + podcast-episode link（一次 parse，連結同全部 href 一齊出）
+            articles, hrefs = links_from_html_anywhere(html_text, base=url)
+            found_articles.update(articles)
+
+            # 2) 將頁面內可巡航 link 入隊（用返上面嘅 href，唔再 parse）
+            for href in hrefs:
+                href = canonical_url(href)
+                if not href or href in seen_pages:
+                    continue
+                if should_visit(href):
+                    seen_pages.add(href)
+                    q.append(href)
+
+            pages_visited += 1
 
     return list(found_articles)
 
 # ---------------- D) Google News 補位（解 redirect） ----------------
+ABS_URL_RE = re.compile(r'https?://[^\s\'">]+')
+
 def extract_sbs_url_from_text(text: str) -> str | None:
     if not text: return None
     text = html.unescape(text)
-    for m in re.finditer(r'https?://[^\s\'">]+', text):
+    for m in ABS_URL_RE.finditer(text):
         u = m.group(0)
         if SBS_HOST in u:
             return u
@@ -494,7 +730,7 @@ def collect_from_google_news() -> list[str]:
             if not real:
                 continue
             if "/news/" in real and any(seg in real for seg in ("/article/", "/story/", "/podcast-episode/")):
-                urls.append(real)
+                urls.append(canonical_url(real))
     except Exception as e:
         print(f"[WARN] parse google news rss fail: {e}", file=sys.stderr)
         return []
@@ -504,6 +740,41 @@ def collect_from_google_news() -> list[str]:
             seen.add(u); uniq.append(u)
     return uniq
 
+# ---------------- 文章快取（conditional GET） ----------------
+def load_cache(path: str = CACHE_PATH) -> dict:
+    """{ canonical_url: {"etag", "lastModified", "item", "ts"} }；冇檔 / 壞檔就當空"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def save_cache(cache: dict, path: str = CACHE_PATH) -> None:
+    """寫返快取；超過 CACHE_MAX_AGE_DAYS 冇再見過嘅 URL 順手清走"""
+    cutoff = datetime.now(timezone.utc).timestamp() - CACHE_MAX_AGE_DAYS * 86400
+    kept = {}
+    for u, ent in cache.items():
+        dt = parse_iso_dt(ent.get("ts"))
+        if dt and dt.timestamp() >= cutoff:
+            kept[u] = ent
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(kept, f, ensure_ascii=False, separators=(",", ":"))
+    except Exception as e:
+        print(f"[WARN] write cache fail {path}: {e}", file=sys.stderr)
+
+def conditional_headers(ent: dict | None) -> dict | None:
+    """有舊 ETag / Last-Modified 就帶 If-None-Match / If-Modified-Since"""
+    if not ent or not ent.get("item"):
+        return None
+    h = {}
+    if ent.get("etag"):
+        h["If-None-Match"] = ent["etag"]
+    if ent.get("lastModified"):
+        h["If-Modified-Since"] = ent["lastModified"]
+    return h or None
+
 # ---------------- 輸出 ----------------
 def json_out(items, path):
     now_utc = datetime.now(timezone.utc)
@@ -515,6 +786,11 @@ def json_out(items, path):
         "count": len(items),
         "items": items
     }
+    if orjson is not None:
+        # orjson 直接出 UTF-8 bytes（等同 ensure_ascii=False）
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
@@ -543,14 +819,15 @@ if __name__ == "__main__":
 
     # B) 入口頁直抓（只抓入口首頁；不再嘗試分頁）
     seed_pages = ENTRY_BASES[:]
-    url_to_hint = collect_from_entrypages()
+    url_to_hint, seed_html = collect_from_entrypages()
     urls_b = list(url_to_hint.keys())
     print(f"[INFO] entry page urls: {len(urls_b)}", file=sys.stderr)
 
     # C) /news/ 淺層 BFS（擴大覆蓋；以入口首頁作為 seeds）
     urls_crawl = crawl_news_section(
         seeds=seed_pages,
-        max_pages=120
+        max_pages=120,
+        prefetched=seed_html,
     )
     print(f"[INFO] crawl urls: {len(urls_crawl)}", file=sys.stderr)
 
@@ -561,44 +838,59 @@ if __name__ == "__main__":
         if u not in seen:
             seen.add(u); merged.append(u)
 
-    # 逐篇抓內容（含 Podcast 日期），並套用 URL 優先的 Category
+    # 逐篇抓內容（含 Podcast 日期），並套用 URL 優先的 Category；併發抓 + parse
+    cache = load_cache()
+
+    def fetch_article(u: str, hint: str | None = None) -> dict:
+        """帶 conditional header 抓；304 用返快取 item（更新 fetchedAt），否則 make_item 並寫入快取"""
+        ent = cache.get(u) or {}
+        r = polite_fetch(u, headers=conditional_headers(ent))
+        if r.status_code == 304 and ent.get("item"):
+            item = dict(ent["item"])
+            now = datetime.now(timezone.utc)
+            item["fetchedAt"] = to_iso(now)
+            item["fetchedAtLocal"] = to_iso(as_sydney(now))
+        else:
+            item = make_item(u, r.text, hint_section=hint)
+        cache[u] = {
+            "etag": r.headers.get("ETag") or ent.get("etag"),
+            "lastModified": r.headers.get("Last-Modified") or ent.get("lastModified"),
+            "item": item,
+            "ts": iso_now(),
+        }
+        return item
+
     articles = []
-    for u in merged:
-        try:
-            html_text = fetch(u).text
-            hint = hint_map.get(u)  # 入口頁帶來的分類提示
-            item = make_item(u, html_text, hint_section=hint)
-            articles.append(item)
-            time.sleep(FETCH_SLEEP)
-        except Exception as e:
-            print(f"[WARN] fetch article fail {u}: {e}", file=sys.stderr)
+    # hint：入口頁帶來的分類提示
+    for u, item, err in fetch_many(merged, lambda u: fetch_article(u, hint_map.get(u))):
+        if err is not None:
+            print(f"[WARN] fetch article fail {u}: {err}", file=sys.stderr)
+            continue
+        articles.append(item)
 
     # D) 如果仍然未夠 → Google News 補位
     if len(articles) < MAX_ITEMS // 2:
         print("[INFO] few items; fallback Google News", file=sys.stderr)
         urls_gn = collect_from_google_news()
         print(f"[INFO] google news urls: {len(urls_gn)}", file=sys.stderr)
-        for u in urls_gn:
-            try:
-                html_text = fetch(u).text
-                item = make_item(u, html_text)
-                # 去重（以 link 去重）
-                if any(x["link"] == item["link"] for x in articles):
-                    continue
-                articles.append(item)
-                time.sleep(FETCH_SLEEP)
-            except Exception as e:
-                print(f"[WARN] GN article fetch fail {u}: {e}", file=sys.stderr)
+        # 去重（以 link 去重）：set 查，唔使逐條對 articles
+        existing_links = {x["link"] for x in articles}
+        for u, item, err in fetch_many([u for u in urls_gn if u not in existing_links], fetch_article):
+            if err is not None:
+                print(f"[WARN] GN article fetch fail {u}: {err}", file=sys.stderr)
+                continue
+            if item["link"] in existing_links:
+                continue
+            existing_links.add(item["link"])
+            articles.append(item)
+
+    save_cache(cache)
+
+    # 以 publishedAt 排序（desc）；無日期放最後（parse_iso_dt 有 cache）
+    MIN_DT = datetime.min.replace(tzinfo=timezone.utc)
 
-    # 以 publishedAt 排序（desc）；無日期放最後
     def key_dt(it):
-        s = it.get("publishedAt")
-        if not s:
-            return datetime.min.replace(tzinfo=timezone.utc)
-        try:
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
-        except Exception:
-            return datetime.min.replace(tzinfo=timezone.utc)
+        return parse_iso_dt(it.get("publishedAt")) or MIN_DT
 
     articles.sort(key=key_dt, reverse=True)
     latest = articles[:MAX_ITEMS]
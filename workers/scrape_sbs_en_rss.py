@@ -1,8 +1,13 @@
 # workers/scrape_sbs_en_rss.py
 import json, hashlib, requests, feedparser
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from datetime import datetime, timezone
 
+try:
+    import orjson  # 快好多嘅 JSON 序列化；冇裝就用返 json
+except Exception:
+    orjson = None
+
 HEADERS = {"User-Agent": "HKersInOZBot/1.0 (+news-aggregator; contact: you@example.com)"}
 TIMEOUT = 20
 MAX_ITEMS = 120
@@ -12,6 +17,10 @@ SOURCE_NAME = "SBS English"
 def iso_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+def item_id(key: str) -> str:
+    """item id：blake2b（16 bytes ➜ 32 位 hex，同以前 md5 長度一樣），比 md5 快"""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
 def normalize_date(raw: str | None) -> str | None:
     if not raw:
         return None
@@ -38,7 +47,10 @@ def fetch_date_from_page(url: str) -> str | None:
     try:
         r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        try:
+            soup = BeautifulSoup(r.text, "lxml")
+        except FeatureNotFound:
+            soup = BeautifulSoup(r.text, "html.parser")
 
         # 1) og:article:published_time / article:published_time
         for key in ("article:published_time", "og:article:published_time"):
@@ -79,7 +91,7 @@ def fetch_items() -> list[dict]:
             published = normalize_date(published) or fetch_date_from_page(link)
 
         item = {
-            "id": hashlib.md5(link.encode()).hexdigest() if link else hashlib.md5(title.encode()).hexdigest(),
+            "id": item_id(link or title),
             "title": title or link,
             "link": link,
             "summary": summary,
@@ -97,6 +109,11 @@ def json_out(items: list[dict], path: str):
         "count": len(items),
         "items": items
     }
+    if orjson is not None:
+        # orjson 直接出 UTF-8 bytes（等同 ensure_ascii=False）
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
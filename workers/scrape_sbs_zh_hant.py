@@ -1,22 +1,59 @@
 # workers/scrape_sbs_zh_hant.py
-import json, re, sys, html, hashlib, time
+import argparse, json, re, sys, html, hashlib, time, queue, threading
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from urllib.parse import urlparse, parse_qs, unquote, urljoin
 from collections import deque
+from itertools import chain
+from functools import lru_cache
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from xml.etree import ElementTree as ET
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup  # 淨係型別提示用；真正 import 等到 make_soup 先做
+
+try:
+    from lxml import html as LH  # C parser + XPath，淨係攞 meta / JSON-LD 唔使砌成棵 soup；冇裝就退返 bs4
+    from lxml import etree as LET  # sitemap 串流解析
+except Exception:
+    LH = LET = None
+
+try:
+    import orjson  # 快好多嘅 JSON 序列化；冇裝就用返 json
+except Exception:
+    orjson = None
+
+try:
+    import httpx  # HTTP/2 多工（pip install "httpx[http2]"）；冇裝就退返 requests
+except Exception:
+    httpx = None
+
 # ---------------- 基本設定 ----------------
 HEADERS = {
     "User-Agent": "HKersInOZBot/1.0 (+news-aggregator; contact: you@example.com)",
     "Accept-Language": "zh-HK,zh-TW;q=0.9,zh;q=0.8,en;q=0.5",
 }
+try:
+    import brotli  # noqa: F401  有裝先敢要 br（urllib3 要靠佢解壓）
+    HEADERS["Accept-Encoding"] = "gzip, deflate, br"
+except Exception:
+    HEADERS["Accept-Encoding"] = "gzip, deflate"
 TIMEOUT = 25
 MAX_ITEMS = 200            # 想多啲就加大
-FETCH_SLEEP = 0.5         # 抓單篇之間小睡，對站方友善
+FETCH_SLEEP = 0.5         # 同一 host 兩個請求起步最少相隔幾秒，對站方友善
+FETCH_WORKERS = 8         # 併發抓文章 thread 數
+PER_HOST_LIMIT = 2        # 同一 host 最多同時幾個請求（politeness）
+# 文章頁只要 <head>（meta / JSON-LD）：先試攞頭 16KB，伺服器肯就回 206
+HEAD_RANGE = "bytes=0-16383"
+CACHE_PATH = "sbs_zh_hant_cache.json"   # 上次抓過嘅文章：ETag / Last-Modified + item（conditional GET 用）；非繁體頁記 zhHant=False
+CACHE_MAX_AGE_DAYS = 7
+REVALIDATE_HOURS = 24   # 快取 item 喺呢段時間內驗證過就直接用，連 conditional GET 都唔發
 
 SBS_HOST = "www.sbs.com.au"
 ROBOTS_URL = "https://www.sbs.com.au/robots.txt"
@@ -51,6 +88,10 @@ GN_URL = (
 def iso_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+def item_id(key: str) -> str:
+    """item id：blake2b（16 bytes ➜ 32 位 hex，同以前 md5 長度一樣），比 md5 快"""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
 def to_iso(dt: datetime) -> str:
     """安全輸出 ISO8601（保留偏移）"""
     return dt.isoformat()
@@ -69,8 +110,19 @@ def as_sydney(dt_utc: datetime | None) -> datetime | None:
         return None
     return dt_utc.astimezone(SYD)
 
+# 今次執行嘅抓取時間：全部 item 共用一個（同一輪 run 抓嘅，唔使逐個 item 再攞鐘）
+FETCHED_UTC = datetime.now(timezone.utc)
+FETCHED_AT = to_iso(FETCHED_UTC)
+FETCHED_AT_LOCAL = to_iso(as_sydney(FETCHED_UTC))
+
+_WS_RE = re.compile(r"\s+")
+
+def _uniq(seq) -> list:
+    """保序去重（dict.fromkeys 喺 C 層做，一次過）"""
+    return list(dict.fromkeys(seq))
+
 def clean(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return _WS_RE.sub(" ", (s or "")).strip()
 
 def normalize_date(raw: str | None) -> str | None:
     """標準化常見日期格式為 UTC ISO8601。"""
@@ -105,21 +157,350 @@ def normalize_date(raw: str | None) -> str | None:
     except Exception:
         return None
 
-def fetch(url: str) -> requests.Response:
-    r = requests.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
-    r.raise_for_status()
+def make_soup(html_text: str) -> "BeautifulSoup":
+    """
+    HTML ➜ soup：用 lxml 做 builder（C parser，快過 html.parser 好多）；
+    冇裝 lxml 先退返 html.parser。每頁只 parse 一次，soup 傳落去各 helper 共用。
+    bs4 喺度先 import（同 feedgen 一樣 lazy）：行 lxml / regex 快速路徑嘅 run 唔使載佢。
+    """
+    from bs4 import BeautifulSoup, FeatureNotFound
+    try:
+        return BeautifulSoup(html_text, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html_text, "html.parser")
+
+def parse_html(html_text: str):
+    """
+    HTML ➜ 文件樹：有 lxml 就用 lxml.html（XPath），否則 BeautifulSoup。
+    下面幾個 helper 兩種樹都食得，make_item 只 parse 一次再傳落去。
+    """
+    if LH is not None:
+        try:
+            return LH.document_fromstring(html_text)
+        except ValueError:
+            # 帶 <?xml encoding=...?> 聲明嘅 str lxml 唔收，轉返 bytes
+            return LH.document_fromstring(html_text.encode("utf-8"))
+        except Exception:
+            pass
+    return make_soup(html_text)
+
+def _is_soup(doc) -> bool:
+    """睇 class 嘅 module 分 soup / lxml 樹，唔使為咗 isinstance 先 import bs4
+    （soup 嘅 getattr 會當 tag 名搵，hasattr 分唔到）"""
+    return type(doc).__module__.startswith("bs4")
+
+def _as_doc(doc):
+    """接受 HTML 字串或已 parse 好嘅樹（lxml / soup）"""
+    return parse_html(doc) if isinstance(doc, (str, bytes)) else doc
+
+# ---- regex 快速路徑：唔 parse 成頁，直接喺原始 HTML 攞 JSON-LD / <meta> ----
+_LD_JSON_RE = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.I)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.S | re.I)
+_TIME_DT_RE = re.compile(r'<time\b[^>]*\bdatetime\s*=\s*["\']([^"\']+)', re.I)
+_HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+
+def _ld_texts(doc) -> list[str]:
+    """所有 <script type="...ld+json"> 嘅內容；HTML 字串就用 regex，搵唔到先 parse"""
+    if isinstance(doc, str):
+        found = _LD_JSON_RE.findall(doc)
+        if found or "ld+json" not in doc:
+            return found
+        doc = parse_html(doc)  # 有 ld+json 但寫法 regex 食唔到，先 parse
+    if _is_soup(doc):
+        return [tag.string or tag.get_text() or ""
+                for tag in doc.find_all("script", type=lambda t: t and "ld+json" in t)]
+    return [el.text or "" for el in doc.xpath('//script[contains(@type, "ld+json")]')]
+
+def _meta_map(doc) -> dict[str, str]:
+    """一次過掃晒 <meta>：property / name / itemprop ➜ content（同名取第一個）"""
+    if _is_soup(doc):
+        metas = [(m.get("property"), m.get("name"), m.get("itemprop"), m["content"])
+                 for m in doc.find_all("meta", content=True)]
+    else:
+        metas = [(m.get("property"), m.get("name"), m.get("itemprop"), m.get("content"))
+                 for m in doc.xpath("//meta[@content]")]
+    out: dict[str, str] = {}
+    for *keys, content in metas:
+        for key in keys:
+            if key and key not in out:
+                out[key] = content
+    return out
+
+def _title_and_time(doc) -> tuple[str, str | None]:
+    """<title> 文字 + 第一個 <time datetime>"""
+    if _is_soup(doc):
+        t = doc.find("time", attrs={"datetime": True})
+        return (doc.title.string if doc.title else "") or "", (t["datetime"] if t else None)
+    title = doc.findtext(".//title") or ""
+    times = doc.xpath("//time/@datetime")
+    return title, (times[0] if times else None)
+
+# 重試策略：requests 用 urllib3 Retry；HTTP/2 client 用同一組數自己重試 5xx
+RETRY_TOTAL = 2
+RETRY_BACKOFF = 0.3
+RETRY_STATUS = frozenset({502, 503, 504})
+
+def _make_session() -> requests.Session:
+    """共用 Session：差唔多全部都係 www.sbs.com.au，keep-alive 重用連線，唔使每個 request 再握手"""
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF, status_forcelist=list(RETRY_STATUS)),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+SESSION = _make_session()
+
+def _make_h2_client():
+    """
+    全部都係 www.sbs.com.au：HTTP/2 client 只開一條 TLS 連線，多條 thread 嘅 request 喺上面多工，
+    唔使好似 HTTP/1.1 咁一條連線一次一個。未裝 httpx 或 h2 就回 None（退返 SESSION）。
+    """
+    if httpx is None:
+        return None
+    try:
+        # transport 嘅 retries 只重試連線失敗；5xx 由 _h2_get / fetch_head_only 照 RETRY_* 處理
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=RETRY_TOTAL,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        )
+        return httpx.Client(
+            transport=transport,
+            headers=HEADERS,
+            timeout=httpx.Timeout(TIMEOUT, connect=8.0),
+            follow_redirects=True,
+        )
+    except Exception as e:
+        print(f"[WARN] http2 client unavailable, fallback requests: {e}", file=sys.stderr)
+        return None
+
+H2_CLIENT = _make_h2_client()
+
+def _h2_backoff(attempt: int) -> None:
+    """第 attempt 次重試之前瞓一陣（同 urllib3 Retry 一樣指數退避）"""
+    if attempt:
+        time.sleep(RETRY_BACKOFF * (2 ** (attempt - 1)))
+
+def _h2_get(url: str, headers: dict | None = None):
+    """HTTP/2 GET；RETRY_STATUS（502/503/504）最多重試 RETRY_TOTAL 次，同 SESSION 嘅 Retry 看齊"""
+    for attempt in range(RETRY_TOTAL + 1):
+        _h2_backoff(attempt)
+        r = H2_CLIENT.get(url, headers=headers)
+        if r.status_code not in RETRY_STATUS:
+            break
     return r
 
+# ---------------- 每 host 限流（所有請求都經呢度） ----------------
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        sem = _HOST_SLOTS.get(host)
+        if sem is None:
+            sem = _HOST_SLOTS[host] = threading.BoundedSemaphore(PER_HOST_LIMIT)
+    return sem
+
+_NEXT_HIT: dict[str, float] = {}   # host ➜ 下一個請求最早可以幾時起步（monotonic）
+_NEXT_HIT_LOCK = threading.Lock()
+
+def _wait_turn(url: str) -> None:
+    """按 host 排期：同 host 請求起步相隔 FETCH_SLEEP；唔同 host 互不拖慢"""
+    host = urlparse(url).netloc
+    with _NEXT_HIT_LOCK:
+        now = time.monotonic()
+        start = max(now, _NEXT_HIT.get(host, 0.0))
+        _NEXT_HIT[host] = start + FETCH_SLEEP
+    if start > now:
+        time.sleep(start - now)
+
+def fetch(url: str, headers: dict | None = None):
+    """
+    有 HTTP/2 client 就用，否則用 SESSION；兩邊 response 都有 .text / .content / .headers。
+    同 host 最多 PER_HOST_LIMIT 個請求同時進行，起步按 host 排隊相隔 FETCH_SLEEP。
+    """
+    with _host_slot(url):
+        _wait_turn(url)
+        if H2_CLIENT is not None:
+            r = _h2_get(url, headers=headers)
+        else:
+            r = SESSION.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True)
+    if r.status_code != 304:  # httpx 當 3xx 係錯；conditional GET 嘅 304 要放行
+        r.raise_for_status()
+    return r
+
+_HEAD_END_B_RE = re.compile(rb"</head\s*>", re.I)
+
+def _stream(url: str, headers: dict | None = None):
+    """串流 GET 嘅 context manager + chunk iterator：HTTP/2 client 優先，否則 SESSION"""
+    if H2_CLIENT is not None:
+        cm = H2_CLIENT.stream("GET", url, headers=headers)
+        return cm, lambda r, n: r.iter_bytes(chunk_size=n)
+    cm = SESSION.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True, stream=True)
+    return cm, lambda r, n: r.iter_content(chunk_size=n)
+
+def fetch_head_only(url: str, headers: dict | None = None, chunk_size: int = 4096) -> tuple[object, bytes, bool]:
+    """
+    串流 GET：一見到 </head> 就收線，meta / JSON-LD / 語言標記全部喺 <head>。
+    配合 Range：伺服器唔理 Range 照回 200 成頁，都唔會下載成個 body。
+    回 (response, 已收到嘅 bytes, 係咪唔完整)；唔完整即 206 或者中途收線。
+    唔即刻 decode：呼叫方先喺 bytes 判繁體，唔係就成頁唔使 decode。
+    同 fetch 一樣受每 host 限流；讀 body 期間都佔住個 slot。
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        if H2_CLIENT is not None:
+            _h2_backoff(attempt)
+        with _host_slot(url):
+            _wait_turn(url)
+            cm, chunks = _stream(url, headers)
+            with cm as r:
+                # SESSION 嘅 5xx 由 urllib3 Retry 處理；HTTP/2 client 喺度自己重試
+                if H2_CLIENT is not None and r.status_code in RETRY_STATUS and attempt < RETRY_TOTAL:
+                    continue
+                if r.status_code != 304:
+                    r.raise_for_status()
+                buf = bytearray()
+                cut = False
+                for chunk in chunks(r, chunk_size):
+                    start = max(0, len(buf) - 16)  # </head> 可能橫跨兩個 chunk
+                    buf.extend(chunk)
+                    if _HEAD_END_B_RE.search(buf, start):
+                        cut = True
+                        break
+        break
+    return r, bytes(buf), cut or r.status_code == 206
+
+def fetch_many(urls: list[str], fn):
+    """
+    用 thread pool 併發做 fn(url)，按輸入次序 yield (url, result, error)。
+    只預先排 2×FETCH_WORKERS 個：呼叫方夠數 break，就唔會再抓後面嘅（未開始嘅即取消）。
+    禮貌限流喺 fetch 層（每 host PER_HOST_LIMIT + 起步間隔），呢度唔使再瞓。
+    """
+    def call(u):
+        try:
+            return fn(u), None
+        except Exception as e:
+            return None, e
+
+    if not urls:
+        return
+    ex = ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls)))
+    try:
+        it = iter(urls)
+        window = deque()
+        for u in it:
+            window.append((u, ex.submit(call, u)))
+            if len(window) >= 2 * FETCH_WORKERS:
+                break
+        while window:
+            u, fut = window.popleft()
+            nxt = next(it, None)
+            if nxt is not None:
+                window.append((nxt, ex.submit(call, nxt)))
+            res, err = fut.result()
+            yield u, res, err
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+def fetch_pipeline(urls: list[str], fn, maxsize: int = 32):
+    """
+    生產者／消費者：FETCH_WORKERS 條 thread 只做 fn(url)（抓網），結果塞入有上限嘅 queue；
+    呼叫方（main thread）邊 parse 邊等下一批，parse 嘅 CPU 時間同網絡等待重疊。
+    按完成次序 yield (url, result, error)；呼叫方 break 就叫停，未抓嘅唔再抓。
+    """
+    if not urls:
+        return
+    todo: queue.Queue = queue.Queue()
+    for u in urls:
+        todo.put(u)
+    fetched: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    n_workers = min(FETCH_WORKERS, len(urls))
+
+    def put(x) -> bool:
+        # queue 滿就等，但呼叫方叫停咗就唔再塞
+        while not stop.is_set():
+            try:
+                fetched.put(x, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        while not stop.is_set():
+            try:
+                u = todo.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                res, err = fn(u), None
+            except Exception as e:
+                res, err = None, e
+            if not put((u, res, err)):
+                return
+        put(None)  # sentinel：呢條 worker 做完
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(n_workers)]
+    for t in threads:
+        t.start()
+    try:
+        done = 0
+        while done < n_workers:
+            x = fetched.get()
+            if x is None:
+                done += 1
+                continue
+            yield x
+    finally:
+        stop.set()
+
 def looks_zh_hant_by_url(url: str) -> bool:
     return "/zh-hant/" in url
 
+# 三種繁體標記（<html lang>、og:locale、meta language）合併成一條，一次 search
+_ZH_HANT_RE = re.compile(
+    r'<html[^>]+lang=["\']zh-?Hant(?:-[A-Z]{2})?["\']'
+    r'|property=["\']og:locale["\']\s+content=["\']zh_?Hant'
+    r'|name=["\']language["\']\s+content=["\']zh-?Hant',
+    re.I,
+)
+
+_ZH_HANT_B_RE = re.compile(_ZH_HANT_RE.pattern.encode("ascii"), re.I)
+
 def is_zh_hant_by_html(html_text: str) -> bool:
-    patterns = [
-        r'<html[^>]+lang=["\']zh-?Hant(?:-[A-Z]{2})?["\']',
-        r'property=["\']og:locale["\']\s+content=["\']zh_?Hant',
-        r'name=["\']language["\']\s+content=["\']zh-?Hant',
-    ]
-    return any(re.search(p, html_text, re.I) for p in patterns)
+    return _ZH_HANT_RE.search(html_text) is not None
+
+def is_zh_hant_by_bytes(raw: bytes) -> bool:
+    """同 is_zh_hant_by_html，但直接喺未 decode 嘅 bytes 判；連 "hant" 字樣都冇就唔使行 regex"""
+    if b"Hant" not in raw and b"hant" not in raw and b"HANT" not in raw:
+        return False
+    return _ZH_HANT_B_RE.search(raw) is not None
+
+# 頁頭有冇標題 / 日期嘅 bytes 級粗判（對應 make_item 會搵嘅 JSON-LD / meta / <title> / <time>）
+_HEAD_TITLE_B_RE = re.compile(rb'<title[\s>]|og:title|"headline"', re.I)
+_HEAD_DATE_B_RE = re.compile(
+    rb'published_time|modified_time|updated_time|"date(?:Published|Created|Modified)"|"uploadDate"'
+    rb'|name\s*=\s*["\']date["\']|<time\b[^>]*datetime',
+    re.I,
+)
+
+def head_needs_full(u: str, raw: bytes) -> bool:
+    """
+    只攞到頁頭（Range / 串流收線）時，判使唔使補抓全頁；全部喺 bytes 做，唔使 parse。
+    未見繁體標記而頁頭又未完 ➜ 要；係繁體但頁頭搵唔到標題或日期（meta 喺 16KB 之後）➜ 要。
+    """
+    if not (looks_zh_hant_by_url(u) or is_zh_hant_by_bytes(raw)):
+        return _HEAD_END_B_RE.search(raw) is None
+    return not (_HEAD_TITLE_B_RE.search(raw) and _HEAD_DATE_B_RE.search(raw))
 
 # ---------------- 分類（以 URL 為先） ----------------
 def _slug_title_zh(slug: str) -> str:
@@ -157,7 +538,7 @@ def category_from_url(u: str) -> str | None:
     return None
 
 # ---------------- JSON-LD / meta 解析 ----------------
-def parse_json_ld(html_text: str):
+def parse_json_ld(doc):
     """
     由 JSON-LD 取標題/描述/日期/url/分類。
     支援: NewsArticle / Article / BlogPosting / PodcastEpisode / AudioObject。
@@ -165,9 +546,7 @@ def parse_json_ld(html_text: str):
       datePublished > uploadDate > dateCreated > dateModified
     """
     try:
-        soup = BeautifulSoup(html_text, "html.parser")
-        for tag in soup.find_all("script", type=lambda t: t and "ld+json" in t):
-            txt = tag.string or tag.get_text() or ""
+        for txt in _ld_texts(doc):  # 字串交俾 _ld_texts 自己決定使唔使 parse
             try:
                 data = json.loads(txt)
             except Exception:
@@ -224,39 +603,65 @@ def parse_json_ld(html_text: str):
         pass
     return {}
 
-def extract_meta_from_html(html_text: str):
-    soup = BeautifulSoup(html_text, "html.parser")
+def _meta_map_fast(html_text: str) -> dict[str, str]:
+    """同 _meta_map 一樣嘅 dict，但用 regex 喺 <head> 入面掃 <meta>（屬性次序唔拘）"""
+    m = _HEAD_END_RE.search(html_text)
+    head = html_text[:m.start()] if m else html_text
+    out: dict[str, str] = {}
+    for tag in _META_TAG_RE.findall(head):
+        attrs = {k.lower(): (v1 if v1 or not v2 else v2) for k, v1, v2 in _ATTR_RE.findall(tag)}
+        content = attrs.get("content")
+        if content is None:
+            continue
+        for attr in ("property", "name", "itemprop"):
+            key = attrs.get(attr)
+            if key and key not in out:
+                out[key] = html.unescape(content)
+    return out
+
+# 日期：盡量多路徑（含 podcast）；modified / updated 係後備，name=date 最舊式
+_PUB_META_KEYS = (
+    "article:published_time", "og:article:published_time", "og:published_time",
+    "article:modified_time", "og:updated_time",
+    "datePublished", "uploadDate", "date",
+)
+
+def extract_meta_fast(html_text: str):
+    """
+    regex 版 extract_meta_from_html：唔 parse HTML。
+    標題同描述都搵唔到（例如 meta 寫法怪）就回 None，由呼叫方退返 parser。
+    """
+    meta = _meta_map_fast(html_text)
+    title = meta.get("og:title")
+    if not title:
+        m = _TITLE_RE.search(html_text)
+        title = html.unescape(m.group(1)) if m else ""
+    desc = meta.get("og:description") or meta.get("description") or ""
+    if not (title or desc):
+        return None
+    pub = next((meta[k] for k in _PUB_META_KEYS if meta.get(k)), None)
+    if not pub:
+        m = _TIME_DT_RE.search(html_text)
+        pub = m.group(1) if m else None
+    section = meta.get("article:section") or meta.get("section") or ""
+    return clean(title), clean(desc), pub, (section or None)
+
+def extract_meta_from_html(doc):
+    if isinstance(doc, str):
+        fast = extract_meta_fast(doc)
+        if fast is not None:
+            return fast
+    doc = _as_doc(doc)
+    meta = _meta_map(doc)
+    page_title, time_dt = _title_and_time(doc)
     # 標題
-    title = (soup.find("meta", property="og:title") or {}).get("content") \
-        or (soup.title.string if soup.title else "") \
-        or ""
+    title = meta.get("og:title") or page_title or ""
     # 描述
-    desc = (soup.find("meta", property="og:description") or {}).get("content") \
-        or (soup.find("meta", attrs={"name": "description"}) or {}).get("content") \
-        or ""
-    # 日期：盡量多路徑（含 podcast）
-    pub = (
-        (soup.find("meta", property="article:published_time") or {}).get("content")
-        or (soup.find("meta", property="og:article:published_time") or {}).get("content")
-        or (soup.find("meta", property="og:published_time") or {}).get("content")
-        or (soup.find("meta", property="article:modified_time") or {}).get("content")   # 後備
-        or (soup.find("meta", property="og:updated_time") or {}).get("content")        # 後備
-        or (soup.find("meta", attrs={"itemprop": "datePublished"}) or {}).get("content")
-        or (soup.find("meta", attrs={"itemprop": "uploadDate"}) or {}).get("content")
-        or (soup.find("meta", attrs={"name": "date"}) or {}).get("content")            # 最舊式
-        or None
-    )
-    # <time datetime="...">
-    if not pub:
-        t = soup.find("time", attrs={"datetime": True})
-        if t and t.get("datetime"):
-            pub = t["datetime"]
+    desc = meta.get("og:description") or meta.get("description") or ""
+    # 日期；冇就用 <time datetime="...">
+    pub = next((meta[k] for k in _PUB_META_KEYS if meta.get(k)), None) or time_dt
     # 分類後備
-    section = (
-        (soup.find("meta", property="article:section") or {}).get("content")
-        or (soup.find("meta", attrs={"name": "section"}) or {}).get("content")
-        or ""
-    )
+    section = meta.get("article:section") or meta.get("section") or ""
     return clean(title), clean(desc), pub, (section or None)
 
 def make_item(url: str, html_text: str, hint_section: str | None = None):
@@ -264,20 +669,25 @@ def make_item(url: str, html_text: str, hint_section: str | None = None):
     section = category_from_url(url) or hint_section
 
     # 2) 內容頁解析（日期 + 可能的分類後備）
-    ld = parse_json_ld(html_text)
+    #    JSON-LD / meta 先行 regex 快速路徑；兩邊都 miss 先 parse 成頁
+    #    有 ld+json 但 regex 食唔到：喺度 parse 一次，JSON-LD 同 meta 後備共用同一棵樹
+    doc = html_text
+    if "ld+json" in html_text and not _LD_JSON_RE.search(html_text):
+        doc = parse_html(html_text)
+    ld = parse_json_ld(doc)
     if ld:
         title = clean(ld.get("headline", "")) or None
         desc = clean(ld.get("description", "")) or ""
         pub = normalize_date(ld.get("datePublished") or None)
         section = section or (ld.get("articleSection") or None)
         if not title:
-            t2, d2, p2, s2 = extract_meta_from_html(html_text)
+            t2, d2, p2, s2 = extract_meta_from_html(doc)
             title = t2
             desc = desc or d2
             pub = pub or normalize_date(p2)
             section = section or s2
     else:
-        t2, d2, p2, s2 = extract_meta_from_html(html_text)
+        t2, d2, p2, s2 = extract_meta_from_html(doc)
         title = t2
         desc = d2
         pub = normalize_date(p2)
@@ -289,21 +699,19 @@ def make_item(url: str, html_text: str, hint_section: str | None = None):
         pub_dt_utc = ensure_utc(datetime.fromisoformat(pub_iso.replace("Z", "+00:00"))) if pub_iso else None
     except Exception:
         pub_dt_utc = None
-    fetched_dt_utc = datetime.now(timezone.utc)
     pub_local = as_sydney(pub_dt_utc)
-    fetched_local = as_sydney(fetched_dt_utc)
 
     return {
-        "id": hashlib.md5(url.encode()).hexdigest(),
+        "id": item_id(url),
         "title": title or url,
         "link": url,
         "summary": desc,
         # UTC 欄位（排序/比較用）
         "publishedAt": pub_iso,
-        "fetchedAt": to_iso(fetched_dt_utc),
+        "fetchedAt": FETCHED_AT,
         # 悉尼本地時間（顯示用；自動 AEST/AEDT）
         "publishedAtLocal": (to_iso(pub_local) if pub_local else None),
-        "fetchedAtLocal": to_iso(fetched_local),
+        "fetchedAtLocal": FETCHED_AT_LOCAL,
         "localTimezone": "Australia/Sydney",
         "source": "SBS 中文（繁體）",
         "sourceCategory": section,  # 👈 新增分類
@@ -320,27 +728,53 @@ def sitemaps_from_robots() -> list[str]:
         return []
     return SITEMAP_RE.findall(txt)
 
-def parse_sitemap_urls(xml_text: str) -> list[str]:
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+SM_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+LOC_RE = re.compile(r"<loc>\s*(.*?)\s*</loc>")
+
+def iter_sitemap_locs(content: bytes):
+    """
+    lxml iterparse：逐個 <loc> yield（url / sitemap 都係 loc），用完即 clear 兼剷走前面兄弟，
+    大 sitemap 都唔使成棵樹留喺記憶體，亦唔使 findall 行兩次。
+    """
+    for _, el in LET.iterparse(BytesIO(content), events=("end",), tag="{%s}loc" % SM_NS):
+        if el.text:
+            yield el.text.strip()
+        el.clear()
+        parent = el.getparent()
+        if parent is not None:
+            while parent.getprevious() is not None:
+                del parent.getparent()[0]
+
+def parse_sitemap_urls(xml: bytes | str) -> list[str]:
+    ns = {"sm": SM_NS}
+    if isinstance(xml, str):
+        xml = xml.encode("utf-8")
+    if LET is not None:
+        try:
+            return list(iter_sitemap_locs(xml))
+        except Exception:
+            pass
     urls = []
     try:
-        root = ET.fromstring(xml_text)
+        root = ET.fromstring(xml)
         for loc in root.findall(".//sm:url/sm:loc", ns):
             if loc.text: urls.append(loc.text.strip())
         for loc in root.findall(".//sm:sitemap/sm:loc", ns):
             if loc.text: urls.append(loc.text.strip())
     except ET.ParseError:
-        urls = [m.group(1) for m in re.finditer(r"<loc>\s*(.*?)\s*</loc>", xml_text)]
+        urls = LOC_RE.findall(xml.decode("utf-8", "replace"))
     return urls
 
 def collect_from_sitemaps() -> list[str]:
     all_sitemaps = sitemaps_from_robots()
     out = []
-    for sm in all_sitemaps:
-        if not sm.lower().endswith(".xml"):
-            continue
+    xml_sitemaps = [sm for sm in all_sitemaps if sm.lower().endswith(".xml")]
+    # 併發抓子 sitemap，按次序 parse；夠數 break 時 fetch_many 會取消未開始嘅
+    # .content：bytes 直接交 iterparse，唔使先 decode 成 str
+    for sm, xml, err in fetch_many(xml_sitemaps, lambda sm: fetch(sm).content):
         try:
-            xml = fetch(sm).text
+            if err is not None:
+                raise err
             urls = parse_sitemap_urls(xml)
             for u in urls:
                 # 收中文區嘅文章 + podcast-episode
@@ -351,12 +785,7 @@ def collect_from_sitemaps() -> list[str]:
             continue
         if len(out) >= 12 * MAX_ITEMS:
             break
-    # 去重
-    seen = set(); uniq = []
-    for u in out:
-        if u not in seen:
-            seen.add(u); uniq.append(u)
-    return uniq
+    return _uniq(out)
 
 # ---------------- B) 入口頁抽 link（含 script/JSON） ----------------
 ARTICLE_HREF_RE = re.compile(
@@ -365,8 +794,15 @@ ARTICLE_HREF_RE = re.compile(
 REL_ARTICLE_RE = re.compile(
     r'/(?:language/chinese(?:/zh-hant)?)/(?:article|podcast-episode)/[A-Za-z0-9\-/_]+'
 )
+# 入口頁 <a href>：相對 / 絕對都食，唔使砌 DOM
+_ENTRY_HREF_RE = re.compile(
+    r'href\s*=\s*["\']((?:https?://www\.sbs\.com\.au)?/language/chinese/[^"\']*?/(?:article|podcast-episode)/[^"\']+)',
+    re.I,
+)
 
 # --- 規範化/清洗 SBS 連結 ---
+_TRAILING_ENC_WS_RE = re.compile(r'(?:%20|%09|%0A|%0D)+$', re.I)
+
 def sanitize_sbs_url(u: str, base: str) -> str | None:
     if not u:
         return None
@@ -385,7 +821,7 @@ def sanitize_sbs_url(u: str, base: str) -> str | None:
     # 去尾部標點
     u0 = u0.rstrip('"\')]>.,')
     # 去尾部編碼空白（%20、%09、%0A、%0D）
-    u0 = re.sub(r'(?:%20|%09|%0A|%0D)+$', '', u0, flags=re.IGNORECASE)
+    u0 = _TRAILING_ENC_WS_RE.sub('', u0)
     # 基本合法性
     p = urlparse(u0)
     if not (p.scheme in ("http", "https") and p.netloc):
@@ -397,26 +833,14 @@ def sanitize_sbs_url(u: str, base: str) -> str | None:
         return None
     return u0
 
-def links_from_html_anywhere(html_text: str, base: str) -> list[str]:
-    links: list[str] = []
-    seen: set[str] = set()
-    soup = BeautifulSoup(html_text, "html.parser")
-    # 1) <a>
-    for a in soup.find_all("a", href=True):
-        href_raw = a["href"]
-        href = sanitize_sbs_url(href_raw, base)
-        if href and href not in seen:
-            seen.add(href); links.append(href)
-    # 2) script/JSON 文字內的 URL
-    for m in ARTICLE_HREF_RE.finditer(html_text):
-        u = sanitize_sbs_url(m.group(0), base)
-        if u and u not in seen:
-            seen.add(u); links.append(u)
-    for m in REL_ARTICLE_RE.finditer(html_text):
-        u = sanitize_sbs_url(urljoin(base, m.group(0)), base)
-        if u and u not in seen:
-            seen.add(u); links.append(u)
-    return links
+def links_from_html_fast(html_text: str, base: str) -> list[str]:
+    """頁內中文區文章 / Podcast link：<a href> 同 script/JSON 文字都用 regex 掃，唔 parse 成頁"""
+    cands = chain(
+        (sanitize_sbs_url(urljoin(base, html.unescape(m.group(1))), base) for m in _ENTRY_HREF_RE.finditer(html_text)),
+        (sanitize_sbs_url(m.group(0), base) for m in ARTICLE_HREF_RE.finditer(html_text)),
+        (sanitize_sbs_url(urljoin(base, m.group(0)), base) for m in REL_ARTICLE_RE.finditer(html_text)),
+    )
+    return _uniq(u for u in cands if u)
 
 def category_from_entry_base(base: str) -> str | None:
     """由入口 base URL 推斷分類（hint）"""
@@ -434,21 +858,26 @@ def category_from_entry_base(base: str) -> str | None:
 def collect_from_entrypages() -> dict[str, str | None]:
     """對每個入口首頁抓連結，回傳 { article_url: category_hint_or_None }"""
     out: dict[str, str | None] = {}
-    for base in ENTRY_BASES:
-        hint = category_from_entry_base(base)
-        try:
-            # 只抓入口首頁；不再嘗試分頁
-            html_text = fetch(base).text
-            for u in links_from_html_anywhere(html_text, base=base):
-                if u not in out:
-                    out[u] = hint
-        except Exception as e:
-            print(f"[WARN] entry scrape fail {base}: {e}", file=sys.stderr)
+    # 只抓入口首頁；不再嘗試分頁。幾個入口併發抓，結果按 ENTRY_BASES 次序合併
+    for base, html_text, err in fetch_many(ENTRY_BASES, lambda b: fetch(b).text):
+        if err is not None:
+            print(f"[WARN] entry scrape fail {base}: {err}", file=sys.stderr)
             continue
-        time.sleep(0.2)
+        hint = category_from_entry_base(base)
+        for u in links_from_html_fast(html_text, base=base):
+            out.setdefault(u, hint)
     return out
 
 # ---------------- C) 中文區淺層 BFS 爬（擴大覆蓋） ----------------
+def _page_hrefs(html_text: str) -> list[str]:
+    """頁內所有 <a href>：有 lxml 就 //a/@href（唔砌 soup），冇先退返 soup"""
+    if not html_text.strip():
+        return []  # 空頁 lxml 唔收，唔好為咗佢退去 soup
+    doc = parse_html(html_text)
+    if _is_soup(doc):
+        return [a["href"] for a in doc.find_all("a", href=True)]
+    return [str(h) for h in doc.xpath("//a/@href")]
+
 def should_visit(url: str) -> bool:
     if not url.startswith(SECTION_ALLOWED_PREFIXES):
         return False
@@ -475,16 +904,14 @@ def crawl_chinese_section(seeds: list[str], max_pages: int = 80) -> list[str]:
             print(f"[WARN] crawl fetch fail {url}: {e}", file=sys.stderr)
             continue
 
-        # 1) 抽文章 + podcast-episode link
-        for art in links_from_html_anywhere(html_text, base=url):
+        # 1) 抽文章 + podcast-episode link（regex，唔 parse）
+        for art in links_from_html_fast(html_text, base=url):
             if art not in seen_articles:
                 seen_articles.add(art)
                 found_articles.append(art)
 
-        # 2) 將頁面內可巡航 link 入隊
-        soup = BeautifulSoup(html_text, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        # 2) 將頁面內可巡航 link 入隊（lxml XPath 攞 href）
+        for href in _page_hrefs(html_text):
             if href.startswith("/"):
                 href = urljoin(url, href)
             if not href or href in seen_pages:
@@ -494,21 +921,25 @@ def crawl_chinese_section(seeds: list[str], max_pages: int = 80) -> list[str]:
                 q.append(href)
 
         pages_visited += 1
-        time.sleep(FETCH_SLEEP)
 
     return found_articles
 
 # ---------------- D) Google News 補位（解 redirect） ----------------
+_SBS_URL_RE = re.compile(r'https?://www\.sbs\.com\.au/[^\s\'">]+')
+_SBS_PREFIXES = ("https://www.sbs.com.au/", "http://www.sbs.com.au/")
+
 def extract_sbs_url_from_text(text: str) -> str | None:
-    if not text: return None
-    text = html.unescape(text)
-    for m in re.finditer(r'https?://[^\s\'">]+', text):
-        u = m.group(0)
-        if SBS_HOST in u:
-            return u
-    return None
+    # 冇 host 字樣就唔使 unescape / 掃
+    if not text or SBS_HOST not in text:
+        return None
+    m = _SBS_URL_RE.search(html.unescape(text) if "&" in text else text)
+    return m.group(0) if m else None
 
+@lru_cache(maxsize=None)  # Google News 同一篇成日重複出現，解過就唔使再掃
 def decode_gn_item_to_article_url(link_text: str, guid_text: str | None, desc_html: str | None) -> str | None:
+    # 常見情況：link 本身已經係 SBS URL，前綴一比即走
+    if link_text.startswith(_SBS_PREFIXES):
+        return link_text
     if link_text and SBS_HOST in link_text:
         return link_text.strip()
     if guid_text and SBS_HOST in guid_text:
@@ -548,23 +979,76 @@ def collect_from_google_news() -> list[str]:
     except Exception as e:
         print(f"[WARN] parse google news rss fail: {e}", file=sys.stderr)
         return []
-    seen = set(); uniq = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u); uniq.append(u)
-    return uniq
+    return _uniq(urls)
+
+# ---------------- 文章快取（conditional GET） ----------------
+def load_cache(path: str = CACHE_PATH) -> dict:
+    """{ url: {"etag", "lastModified", "item", "ts"} }；冇檔 / 壞檔就當空"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def save_cache(cache: dict, path: str = CACHE_PATH) -> None:
+    """寫返快取；超過 CACHE_MAX_AGE_DAYS 冇再見過嘅 URL 順手清走"""
+    cutoff = FETCHED_UTC.timestamp() - CACHE_MAX_AGE_DAYS * 86400
+    kept = {}
+    for u, ent in cache.items():
+        try:
+            ts = ensure_utc(datetime.fromisoformat(ent.get("ts") or "")).timestamp()
+        except Exception:
+            continue
+        if ts >= cutoff:
+            kept[u] = ent
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(kept, f, ensure_ascii=False, separators=(",", ":"))
+    except Exception as e:
+        print(f"[WARN] write cache fail {path}: {e}", file=sys.stderr)
+
+def conditional_headers(ent: dict | None) -> dict:
+    """有舊 ETag / Last-Modified 就帶 If-None-Match / If-Modified-Since"""
+    h = {}
+    if not ent or not ent.get("item"):
+        return h
+    if ent.get("etag"):
+        h["If-None-Match"] = ent["etag"]
+    if ent.get("lastModified"):
+        h["If-Modified-Since"] = ent["lastModified"]
+    return h
+
+def cached_fresh_item(ent: dict | None) -> dict | None:
+    """
+    上次真係上網驗證（200 / 304）喺 REVALIDATE_HOURS 之內就回快取 item（更新 fetchedAt），否則 None。
+    穩定期大部份 URL 都見過，每輪只需要抓真正新嘅嗰幾篇。
+    """
+    if not ent or not ent.get("item"):
+        return None
+    try:
+        checked = ensure_utc(datetime.fromisoformat(ent.get("checked") or ent.get("ts") or ""))
+    except Exception:
+        return None
+    if (FETCHED_UTC - checked).total_seconds() > REVALIDATE_HOURS * 3600:
+        return None
+    return dict(ent["item"], fetchedAt=FETCHED_AT, fetchedAtLocal=FETCHED_AT_LOCAL)
 
 # ---------------- 輸出 ----------------
 def json_out(items, path):
-    now_utc = datetime.now(timezone.utc)
     payload = {
         "source": "SBS 中文（繁體）",
-        "generatedAt": to_iso(now_utc),
-        "generatedAtLocal": to_iso(as_sydney(now_utc)),
+        "generatedAt": FETCHED_AT,
+        "generatedAtLocal": FETCHED_AT_LOCAL,
         "localTimezone": "Australia/Sydney",
         "count": len(items),
         "items": items,
     }
+    if orjson is not None:
+        # orjson 直接出 UTF-8 bytes（等同 ensure_ascii=False）
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
 
@@ -586,14 +1070,26 @@ def rss_out(items, path):
     fg.rss_file(path)
 
 # ---------------- 主程式 ----------------
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="SBS 中文（繁體）聚合")
+    ap.add_argument(
+        "--strategy", choices=("auto", "sitemap", "entry", "gn"), default="auto",
+        help="auto：sitemap + 入口頁/BFS，唔夠先 Google News（預設）；"
+             "sitemap / entry / gn：只行嗰一路（除錯或者單獨重跑用）",
+    )
+    return ap.parse_args(argv)
+
 if __name__ == "__main__":
+    strategy = parse_args().strategy
+    use = lambda name: strategy in ("auto", name)
+
     # A) robots 所有 sitemap
-    urls_a = collect_from_sitemaps()
+    urls_a = collect_from_sitemaps() if use("sitemap") else []
     print(f"[INFO] sitemap urls: {len(urls_a)}", file=sys.stderr)
 
     # B) 入口頁直抓（只抓入口首頁；不再嘗試分頁）
     seed_pages = ENTRY_BASES[:]
-    url_to_hint = collect_from_entrypages()
+    url_to_hint = collect_from_entrypages() if use("entry") else {}
     urls_b = list(url_to_hint.keys())
     print(f"[INFO] entry page urls: {len(urls_b)}", file=sys.stderr)
 
@@ -601,53 +1097,122 @@ if __name__ == "__main__":
     urls_crawl = crawl_chinese_section(
         seeds=seed_pages,   # 入口首頁
         max_pages=80
-    )
+    ) if use("entry") else []
     print(f"[INFO] crawl urls: {len(urls_crawl)}", file=sys.stderr)
 
     # 合併去重（保留入口分類 hint）
     hint_map = dict(url_to_hint)  # article_url -> category_hint
-    seen, merged = set(), []
-    for u in (urls_a + urls_b + urls_crawl):
-        if u not in seen:
-            seen.add(u); merged.append(u)
+    merged = _uniq(chain(urls_a, urls_b, urls_crawl))
 
-    # 逐篇抓：抓多啲先（例如 3 倍），之後再按日期排序截 MAX_ITEMS
-    articles = []
-    HARD_CAP = MAX_ITEMS * 3
-    for u in merged:
-        try:
-            html_text = fetch(u).text
-            if not (looks_zh_hant_by_url(u) or is_zh_hant_by_html(html_text)):
+    cache = load_cache()
+
+    def fetch_article(u: str):
+        """
+        抓網嗰半（喺 fetcher thread 跑）：帶 Range + conditional header，只攞頁頭；
+        頁頭唔夠用就喺 worker 度補抓全頁，主線程只 parse、唔使等網絡。
+        """
+        r, raw, partial = fetch_head_only(u, headers={"Range": HEAD_RANGE, **conditional_headers(cache.get(u) or {})})
+        if r.status_code != 304 and partial and head_needs_full(u, raw):
+            r = fetch(u)
+            raw, partial = r.content, False
+        return r, raw, partial
+
+    def parse_article(u: str, fetched, hint: str | None = None) -> dict | None:
+        """
+        parse 嗰半（喺 main thread 跑）：判繁體 + make_item；唔係繁體回 None。
+        304 就用返快取 item（只更新 fetchedAt），唔使 parse。
+        """
+        r, raw, _ = fetched
+        ent = cache.get(u) or {}
+        if r.status_code == 304 and ent.get("item"):
+            item = dict(ent["item"], fetchedAt=FETCHED_AT, fetchedAtLocal=FETCHED_AT_LOCAL)
+        else:
+            item = item_from_head(u, raw, r.encoding, hint)
+            if item is None:
+                # 記低唔係繁體：CACHE_MAX_AGE_DAYS 內唔再抓（save_cache 按 ts 過期清走）
+                cache[u] = {"zhHant": False, "ts": FETCHED_AT, "checked": FETCHED_AT}
+                return None
+        cache[u] = {
+            "etag": r.headers.get("ETag") or ent.get("etag"),
+            "lastModified": r.headers.get("Last-Modified") or ent.get("lastModified"),
+            "item": item,
+            "ts": FETCHED_AT,
+            "checked": FETCHED_AT,
+        }
+        return item
+
+    def item_from_head(u: str, raw: bytes, encoding: str | None, hint: str | None) -> dict | None:
+        """
+        判繁體 + make_item；唔係繁體回 None。判繁體喺 bytes 做，過咗先 decode。
+        要補抓全頁嘅 fetch_article 已經喺 worker 做咗，呢度唔再上網。
+        """
+        if not (looks_zh_hant_by_url(u) or is_zh_hant_by_bytes(raw)):
+            return None
+        return make_item(u, raw.decode(encoding or "utf-8", errors="replace"), hint_section=hint)
+
+    def split_cached(urls: list[str]) -> tuple[list[dict], list[str]]:
+        """近期驗證過嘅直接攞快取 item（唔發 request）；其餘先要抓"""
+        reused, todo = [], []
+        for u in urls:
+            if (cache.get(u) or {}).get("zhHant") is False:
+                continue  # 之前判過唔係繁體；ts 唔刷新，過期自然會再判
+            item = cached_fresh_item(cache.get(u))
+            if item is None:
+                todo.append(u)
                 continue
-            hint = hint_map.get(u)
-            item = make_item(u, html_text, hint_section=hint)
-            articles.append(item)
-            if len(articles) >= HARD_CAP:
-                break
-            time.sleep(FETCH_SLEEP)
-        except Exception as e:
-            print(f"[WARN] fetch article fail {u}: {e}", file=sys.stderr)
+            ent = cache[u]
+            ent.setdefault("checked", ent.get("ts"))  # 舊格式冇 checked：先釘住，唔好俾 ts 刷新咗當驗證過
+            ent.update(item=item, ts=FETCHED_AT)
+            reused.append(item)
+        return reused, todo
+
+    # 逐篇抓（併發）：抓多啲先（例如 3 倍），之後再按日期排序截 MAX_ITEMS
+    HARD_CAP = MAX_ITEMS * 3
+    articles, todo = split_cached(merged)
+    articles = articles[:HARD_CAP]
+    print(f"[INFO] cached fresh: {len(articles)}, to fetch: {len(todo)}", file=sys.stderr)
+    for u, got, err in fetch_pipeline(todo if len(articles) < HARD_CAP else [], fetch_article):
+        if err is None:
+            try:
+                item = parse_article(u, got, hint_map.get(u))
+            except Exception as e:
+                err = e
+        if err is not None:
+            print(f"[WARN] fetch article fail {u}: {err}", file=sys.stderr)
+            continue
+        if item is None:
+            continue
+        articles.append(item)
+        if len(articles) >= HARD_CAP:
+            break
 
     # D) 如果仍然未夠 → Google News 補位（同樣抓多啲）
-    if len(articles) < MAX_ITEMS // 2:
+    if strategy == "gn" or (strategy == "auto" and len(articles) < MAX_ITEMS // 2):
         print("[INFO] few items; fallback Google News", file=sys.stderr)
         urls_gn = collect_from_google_news()
         print(f"[INFO] google news urls: {len(urls_gn)}", file=sys.stderr)
-        for u in urls_gn:
-            try:
-                html_text = fetch(u).text
-                if not (looks_zh_hant_by_url(u) or is_zh_hant_by_html(html_text)):
-                    continue
-                item = make_item(u, html_text)
-                # 去重（以 link 去重）
-                if any(x["link"] == item["link"] for x in articles):
-                    continue
-                articles.append(item)
-                if len(articles) >= HARD_CAP:
-                    break
-                time.sleep(FETCH_SLEEP)
-            except Exception as e:
-                print(f"[WARN] GN article fetch fail {u}: {e}", file=sys.stderr)
+        have = {x["link"] for x in articles}
+        reused, todo = split_cached([u for u in urls_gn if u not in have])
+        articles.extend(reused[:max(0, HARD_CAP - len(articles))])
+        for u, got, err in fetch_pipeline(todo if len(articles) < HARD_CAP else [], fetch_article):
+            if err is None:
+                try:
+                    item = parse_article(u, got)
+                except Exception as e:
+                    err = e
+            if err is not None:
+                print(f"[WARN] GN article fetch fail {u}: {err}", file=sys.stderr)
+                continue
+            if item is None:
+                continue
+            # 去重（以 link 去重）
+            if any(x["link"] == item["link"] for x in articles):
+                continue
+            articles.append(item)
+            if len(articles) >= HARD_CAP:
+                break
+
+    save_cache(cache)
 
     # 以 publishedAt（ISO 字串）排序（desc）；無日期放最後
     def key_dt(it):